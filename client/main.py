@@ -39,6 +39,7 @@ from network.client import NetworkClient
 from state.game_state import GameState
 from input.handlers import InputHandler, InputState
 from rendering.sprites import SpriteFactory, LightManager
+from rendering.pixel_sprite_loader import preload as preload_pixel_sprites
 from rendering.effects import EffectsManager
 from rendering.trail import TrailRenderer
 from ui.panels import MonsterPanel, ContextPanel
@@ -91,6 +92,10 @@ class MonsterWorkshopClient:
         self.camera_y = 0.0
         self.camera_initialized = False
 
+        # FPS readout (reformatted only when the clock's estimate changes)
+        self._fps_value = None
+        self._fps_text = ""
+
         # Running flag
         self.running = False
 
@@ -246,6 +251,9 @@ class MonsterWorkshopClient:
 
     def _init_subsystems(self):
         """Initialize rendering and UI subsystems."""
+        # Load pixel sprites up front (sprite lookups assume they are loaded)
+        preload_pixel_sprites()
+
         # Sprite factory
         self.sprite_factory = SpriteFactory(self.game_window, self.network.player_id)
 
@@ -306,24 +314,37 @@ class MonsterWorkshopClient:
         # Update game state
         added, updated, removed = self.game_state.sync_entities(entities)
 
-        # Update sprites
-        self.sprite_factory.sync_entities(
-            added, updated, removed, self.game_state.entities
-        )
-
-        # Update lights for entities (skip phased-out monsters)
+        # Split changed entities into phased-out monsters and visible ones
+        # once, so sprites, lights and effects share the same decision
+        hidden = set()
+        visible = {}
         for eid in added | updated:
             entity = self.game_state.get_entity(eid)
             if entity:
                 if self.game_state.is_phased_out(entity):
-                    self.light_manager.remove_entity_light(eid)
-                    self.effects_manager.remove_crafting_effect(eid)
+                    hidden.add(eid)
                 else:
-                    self.light_manager.update_entity_light(eid, entity)
-                    self.effects_manager.update_crafting_effect(eid, entity)
+                    visible[eid] = entity
 
+        # Update sprites
+        self.sprite_factory.sync_entities(
+            added, updated, removed, self.game_state.entities, hidden
+        )
+
+        # Update lights (skip phased-out monsters)
+        if self.light_manager.enabled:
+            for eid in hidden:
+                self.light_manager.remove_entity_light(eid)
+            for eid in removed:
+                self.light_manager.remove_entity_light(eid)
+            self.light_manager.update_entity_lights(visible)
+
+        # Update crafting effects (skip phased-out monsters)
+        for eid in hidden:
+            self.effects_manager.remove_crafting_effect(eid)
+        for eid, entity in visible.items():
+            self.effects_manager.update_crafting_effect(eid, entity)
         for eid in removed:
-            self.light_manager.remove_entity_light(eid)
             self.effects_manager.remove_crafting_effect(eid)
 
         # Create/update player torch
@@ -451,10 +472,16 @@ class MonsterWorkshopClient:
         # Render notifications
         self.notification_manager.render()
 
-        # FPS counter in notification bar
+        # FPS counter in notification bar (pygame only refreshes its estimate
+        # every few ticks, so reuse the formatted text until it changes)
         fps = pyunicodegame._clock.get_fps()
+        if fps != self._fps_value:
+            self._fps_value = fps
+            self._fps_text = f"FPS: {fps:5.1f}"
+        # Nothing blanks row 0 any more; the fixed-width format is what
+        # overwrites the previous readout in place
         self.notification_window.put_string(
-            SCREEN_WIDTH - 12, 0, f"FPS: {fps:5.1f}", Color.TEXT_MUTED
+            SCREEN_WIDTH - 12, 0, self._fps_text, Color.TEXT_MUTED
         )
 
         # Render tutorial bubble
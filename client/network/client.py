@@ -6,7 +6,7 @@ import logging
 import queue
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 import websockets
@@ -24,7 +24,7 @@ class NetworkClient:
         self.player_id: Optional[str] = None
         self.zone_id: Optional[str] = None
 
-        # Thread communication queues
+        # Thread communication queues (state_queue holds raw, undecoded frames)
         self.intent_queue: queue.Queue = queue.Queue()
         self.state_queue: queue.Queue = queue.Queue()
         self.event_queue: queue.Queue = queue.Queue()
@@ -33,6 +33,12 @@ class NetworkClient:
         self._running = False
         self._network_thread: Optional[threading.Thread] = None
 
+        # Tick ordering: states are tagged with (connection, tick_number) so
+        # a reconnect to a restarted server (ticks from 0 again) still applies
+        self._connection_count = 0
+        self._last_applied_tick: Tuple[int, int] = (-1, -1)
+        self._pending_state: Optional[Tuple[Optional[Tuple[int, int]], Dict]] = None
+
         # Callbacks
         self._on_state_update: Optional[Callable[[Dict], None]] = None
         self._on_event: Optional[Callable[[Dict], None]] = None
@@ -236,16 +242,50 @@ class NetworkClient:
     def get_latest_state(self) -> Optional[Dict]:
         """Get the most recent state update, if any.
 
+        Queued frames are decoded here rather than on the network thread.
+        Only the newest tick is returned, and never one older than (or the
+        same as) the tick returned by the previous call. Events from every
+        decoded frame are moved to the event queue.
+
         Returns:
-            The latest state dict, or None if no updates available.
+            The latest state dict, or None if no new updates are available.
         """
-        latest = None
-        while not self.state_queue.empty():
+        frames = []
+        try:
+            while True:
+                frames.append(self.state_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        # Walk newest-first so only the newest tick has to be decoded for its
+        # state; older frames are decoded only if they may carry events/errors
+        decoded = []
+        have_state = False
+        for connection, message in reversed(frames):
+            if have_state and '"events"' not in message and '"error"' not in message:
+                continue
             try:
-                latest = self.state_queue.get_nowait()
-            except queue.Empty:
-                break
-        return latest
+                data = json.loads(message)
+            except ValueError as e:
+                logger.error(f"Malformed server message: {e}")
+                continue
+            if data.get("type") == "tick":
+                have_state = True
+            decoded.append((connection, data))
+
+        for connection, data in reversed(decoded):
+            self._handle_message(data, connection)
+
+        if self._pending_state is None:
+            return None
+
+        tick, state = self._pending_state
+        self._pending_state = None
+        if tick is not None:
+            if tick <= self._last_applied_tick:
+                return None
+            self._last_applied_tick = tick
+        return state
 
     def get_events(self) -> List[Dict]:
         """Get all pending events.
@@ -254,11 +294,11 @@ class NetworkClient:
             List of event dictionaries.
         """
         events = []
-        while not self.event_queue.empty():
-            try:
+        try:
+            while True:
                 events.append(self.event_queue.get_nowait())
-            except queue.Empty:
-                break
+        except queue.Empty:
+            pass
         return events
 
     def _run_network_loop(self):
@@ -269,34 +309,37 @@ class NetworkClient:
         """Main WebSocket communication task."""
         uri = f"{WS_URL}?token={self.token}"
 
+        # The zone is fixed for the lifetime of this task, so encode the
+        # subscribe message once instead of on every reconnect
+        subscribe_msg = json.dumps({"type": "subscribe", "zone_id": self.zone_id})
+
         while self._running:
             try:
                 async with websockets.connect(uri) as websocket:
                     logger.info("Connected to WebSocket")
+                    self._connection_count += 1
 
                     # Subscribe to zone
-                    await websocket.send(
-                        json.dumps({"type": "subscribe", "zone_id": self.zone_id})
-                    )
+                    await websocket.send(subscribe_msg)
 
                     # Main communication loop
                     while self._running:
                         # Send pending intents
-                        while not self.intent_queue.empty():
-                            try:
+                        try:
+                            while True:
                                 intent = self.intent_queue.get_nowait()
                                 await websocket.send(
                                     json.dumps({"type": "intent", "data": intent})
                                 )
-                            except queue.Empty:
-                                break
+                        except queue.Empty:
+                            pass
 
                         # Receive messages with timeout
                         try:
                             message = await asyncio.wait_for(
                                 websocket.recv(), timeout=0.05
                             )
-                            self._handle_message(json.loads(message))
+                            self.state_queue.put((self._connection_count, message))
                         except asyncio.TimeoutError:
                             pass
 
@@ -309,13 +352,20 @@ class NetworkClient:
                 if self._running:
                     await asyncio.sleep(2)
 
-    def _handle_message(self, data: Dict[str, Any]):
-        """Process a message from the server."""
+    def _handle_message(self, data: Dict[str, Any], connection: int):
+        """Process a decoded message from the server.
+
+        Args:
+            data: The decoded message
+            connection: Connection count at the time the frame was received
+        """
         msg_type = data.get("type")
 
         if msg_type == "tick":
             state = data.get("state", {})
-            self.state_queue.put(state)
+            tick_number = data.get("tick_number")
+            tick = None if tick_number is None else (connection, tick_number)
+            self._pending_state = (tick, state)
 
             # Extract and queue events
             events = state.get("events", [])
@@ -1,16 +1,102 @@
 """Visual effects and particle systems."""
 
-import sys
-import os
-from typing import Any, Dict, List, Optional
-
-# Add pyunicodegame to path
-sys.path.insert(0, os.path.expanduser("~/Documents/github/pyunicodegame/src"))
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, Optional
 
 import pyunicodegame
 
 from config import Color
 
+# Number of recent one-shot effects kept referenced
+MAX_ACTIVE_EFFECTS = 32
+
+# Offset of the blocked marker toward the attempted move direction
+_BLOCKED_OFFSETS = {"up": (0, -0.5), "down": (0, 0.5), "left": (-0.5, 0), "right": (0.5, 0)}
+
+# Particle direction (degrees) opposite to each push direction
+_PUSH_OPPOSITE = {"up": 270, "down": 90, "left": 0, "right": 180}
+
+# Crafting effect kind for each workshop type / applied skill
+_CRAFTING_EFFECT_KINDS: Dict[str, str] = {
+    "smithing": "metal",
+    "casting": "metal",
+    "blacksmithing": "metal",
+    "dyeing": "dyeing",
+    "spinning": "textile",
+    "weaving": "textile",
+    "sericulture": "textile",
+    "pottery": "pottery",
+}
+
+# Emitter parameters per crafting effect kind, in priority order (when the
+# workshop type and applied skill map to different kinds, the first wins)
+_CRAFTING_EFFECT_PRESETS: Dict[str, Dict[str, Any]] = {
+    # Orange sparks for metalworking
+    "metal": dict(
+        chars="*+.",
+        colors=[(255, 200, 50), (255, 150, 0), (255, 100, 0)],
+        spawn_rate=8,
+        speed=3,
+        direction=90,  # Upward
+        arc=60,
+        drag=0.5,
+        fade_time=0.8,
+        z_index=50,
+    ),
+    # Blue bubbles for dyeing
+    "dyeing": dict(
+        chars="~o.",
+        colors=[(100, 100, 200), (150, 150, 255), (80, 80, 180)],
+        spawn_rate=4,
+        speed=1,
+        direction=90,
+        arc=30,
+        drag=0.3,
+        fade_time=1.2,
+        z_index=50,
+    ),
+    # Light fiber particles for textiles
+    "textile": dict(
+        chars="~.",
+        colors=[(240, 240, 255), (220, 220, 240)],
+        spawn_rate=3,
+        speed=0.5,
+        direction=90,
+        arc=120,
+        drag=0.2,
+        fade_time=1.5,
+        z_index=50,
+    ),
+    # Brown dust for pottery
+    "pottery": dict(
+        chars=".",
+        colors=[(180, 120, 80), (160, 100, 60)],
+        spawn_rate=2,
+        speed=0.3,
+        direction=0,
+        arc=360,
+        drag=0.4,
+        fade_time=1.0,
+        z_index=50,
+    ),
+    # Default subtle sparkle
+    "default": dict(
+        chars=".",
+        colors=[(200, 200, 200), (180, 180, 180)],
+        spawn_rate=2,
+        speed=0.5,
+        direction=90,
+        arc=180,
+        drag=0.3,
+        fade_time=1.0,
+        z_index=50,
+    ),
+}
+
+# Vertical offset of the emitter from the workshop center, per kind
+_CRAFTING_EFFECT_Y_OFFSETS: Dict[str, float] = {"metal": -1}
+
 
 class EffectsManager:
     """Manages particle effects and visual feedback."""
@@ -26,8 +112,11 @@ class EffectsManager:
         # Active emitters by entity ID
         self.crafting_emitters: Dict[str, Any] = {}
 
-        # One-shot effects
-        self.active_effects: List[Any] = []
+        # Last seen is_crafting flag by entity ID (absent means not crafting)
+        self._crafting_state: Dict[str, bool] = {}
+
+        # Recent one-shot effects (oldest dropped once full)
+        self.active_effects: Deque[Any] = deque(maxlen=MAX_ACTIVE_EFFECTS)
 
     def create_crafting_effect(self, entity_id: str, entity: Dict) -> Optional[Any]:
         """Create a crafting particle effect for a workshop.
@@ -58,81 +147,17 @@ class EffectsManager:
         workshop_type = metadata.get("workshop_type", "").lower()
         primary_skill = metadata.get("primary_applied_skill", "").lower()
 
-        if any(s in (workshop_type, primary_skill) for s in ("smithing", "casting", "blacksmithing")):
-            # Orange sparks for metalworking
-            emitter = pyunicodegame.create_emitter(
-                x=center_x,
-                y=center_y - 1,
-                chars="*+.",
-                colors=[(255, 200, 50), (255, 150, 0), (255, 100, 0)],
-                spawn_rate=8,
-                speed=3,
-                direction=90,  # Upward
-                arc=60,
-                drag=0.5,
-                fade_time=0.8,
-                z_index=50,
-            )
-        elif "dyeing" in (workshop_type, primary_skill):
-            # Blue bubbles for dyeing
-            emitter = pyunicodegame.create_emitter(
-                x=center_x,
-                y=center_y,
-                chars="~o.",
-                colors=[(100, 100, 200), (150, 150, 255), (80, 80, 180)],
-                spawn_rate=4,
-                speed=1,
-                direction=90,
-                arc=30,
-                drag=0.3,
-                fade_time=1.2,
-                z_index=50,
-            )
-        elif any(s in (workshop_type, primary_skill) for s in ("spinning", "weaving", "sericulture")):
-            # Light fiber particles for textiles
-            emitter = pyunicodegame.create_emitter(
-                x=center_x,
-                y=center_y,
-                chars="~.",
-                colors=[(240, 240, 255), (220, 220, 240)],
-                spawn_rate=3,
-                speed=0.5,
-                direction=90,
-                arc=120,
-                drag=0.2,
-                fade_time=1.5,
-                z_index=50,
-            )
-        elif "pottery" in (workshop_type, primary_skill):
-            # Brown dust for pottery
-            emitter = pyunicodegame.create_emitter(
-                x=center_x,
-                y=center_y,
-                chars=".",
-                colors=[(180, 120, 80), (160, 100, 60)],
-                spawn_rate=2,
-                speed=0.3,
-                direction=0,
-                arc=360,
-                drag=0.4,
-                fade_time=1.0,
-                z_index=50,
-            )
-        else:
-            # Default subtle sparkle
-            emitter = pyunicodegame.create_emitter(
-                x=center_x,
-                y=center_y,
-                chars=".",
-                colors=[(200, 200, 200), (180, 180, 180)],
-                spawn_rate=2,
-                speed=0.5,
-                direction=90,
-                arc=180,
-                drag=0.3,
-                fade_time=1.0,
-                z_index=50,
-            )
+        kinds = {
+            _CRAFTING_EFFECT_KINDS.get(workshop_type),
+            _CRAFTING_EFFECT_KINDS.get(primary_skill),
+        }
+        kind = next((k for k in _CRAFTING_EFFECT_PRESETS if k in kinds), "default")
+
+        emitter = pyunicodegame.create_emitter(
+            x=center_x,
+            y=center_y + _CRAFTING_EFFECT_Y_OFFSETS.get(kind, 0),
+            **_CRAFTING_EFFECT_PRESETS[kind],
+        )
 
         self.crafting_emitters[entity_id] = emitter
         self.game_window.add_emitter(emitter)
@@ -144,6 +169,7 @@ class EffectsManager:
         Args:
             entity_id: Workshop entity ID
         """
+        self._crafting_state.pop(entity_id, None)
         emitter = self.crafting_emitters.pop(entity_id, None)
         if emitter:
             emitter.stop()
@@ -156,13 +182,14 @@ class EffectsManager:
             entity_id: Workshop entity ID
             entity: Workshop entity data
         """
-        metadata = entity.get("metadata", {})
-        is_crafting = metadata.get("is_crafting", False)
-        has_emitter = entity_id in self.crafting_emitters
+        is_crafting = bool(entity.get("metadata", {}).get("is_crafting", False))
+        if self._crafting_state.get(entity_id, False) == is_crafting:
+            return
 
-        if is_crafting and not has_emitter:
+        if is_crafting:
+            self._crafting_state[entity_id] = True
             self.create_crafting_effect(entity_id, entity)
-        elif not is_crafting and has_emitter:
+        else:
             self.remove_crafting_effect(entity_id)
 
     def show_blocked_effect(self, x: int, y: int, direction: str):
@@ -173,9 +200,7 @@ class EffectsManager:
             direction: Direction of attempted movement
         """
         # Calculate effect position (slightly in the direction of movement)
-        dx, dy = {"up": (0, -0.5), "down": (0, 0.5), "left": (-0.5, 0), "right": (0.5, 0)}.get(
-            direction, (0, 0)
-        )
+        dx, dy = _BLOCKED_OFFSETS.get(direction, (0, 0))
 
         effect = pyunicodegame.create_effect(
             "X",
@@ -198,7 +223,7 @@ class EffectsManager:
             direction: Direction of push
         """
         # Calculate opposite direction for particles
-        opposite = {"up": 270, "down": 90, "left": 0, "right": 180}.get(direction, 0)
+        opposite = _PUSH_OPPOSITE.get(direction, 0)
 
         emitter = pyunicodegame.create_emitter(
             x=item_x,
@@ -279,9 +304,13 @@ def render_progress_bar(window, x: int, y: int, progress: float, width: int = 8)
         width: Bar width in characters
     """
     filled = int(progress * (width - 2))
-    empty = (width - 2) - filled
-
-    bar = "[" + "=" * filled + "-" * empty + "]"
     color = Color.SUCCESS if progress >= 1.0 else Color.WARNING
 
-    window.put_string(x, y, bar, color)
+    window.put_string(x, y, _bar_string(filled, width), color)
+
+
+@lru_cache(maxsize=256)
+def _bar_string(filled: int, width: int) -> str:
+    """Build (and memoize) the progress bar text for a fill amount."""
+    empty = (width - 2) - filled
+    return "[" + "=" * filled + "-" * empty + "]"
@@ -2,12 +2,16 @@
 
 import json
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pygame
 
+from rendering.sprite_names import good_type_to_sprite_name
+
 
 # Path to item sprite assets
 ASSETS_DIR = Path(__file__).parent / "assets" / "items"
@@ -16,46 +20,161 @@ ASSETS_DIR = Path(__file__).parent / "assets" / "items"
 CELL_WIDTH = 10
 CELL_HEIGHT = 20
 
+# Maximum number of color-transformed sprites kept in memory
+COLORED_CACHE_SIZE = 256
+
+# Width of the sprite atlas in pixels (widened if a sprite is wider)
+ATLAS_WIDTH = 256
+
 
 class PixelSpriteLoader:
-    """Loads and caches pixel sprites with color transformation support."""
+    """Loads and caches pixel sprites with color transformation support.
+
+    The per-frame lookups (get_sprite_surface, get_item_render and
+    get_sprite_dimensions) do not load on demand; call preload() once the
+    display exists.
+    """
 
     def __init__(self):
         self._metadata: Dict[str, Dict[str, Any]] = {}
         self._surfaces: Dict[str, pygame.Surface] = {}
-        self._colored_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+        # All base sprites share one atlas; _surfaces holds subsurfaces of it
+        self._atlas: Optional[pygame.Surface] = None
+        self._rects: Dict[str, pygame.Rect] = {}
+        # Sprite sizes in cells (width_cells, height_cells)
+        self._dimensions: Dict[str, Tuple[int, int]] = {}
+        # Color-transformed sprites, least recently used first
+        self._colored_cache: "OrderedDict[Tuple[str, Tuple[int, int, int]], pygame.Surface]" = (
+            OrderedDict()
+        )
+        # Taker sprites split into (grey layer, detail layer) for tinting
+        self._tint_layers: Dict[str, Tuple[pygame.Surface, pygame.Surface]] = {}
         self._loaded = False
 
-    def load_all(self) -> None:
-        """Load all sprite PNG and JSON metadata files."""
+    def load_all(self, taker_palette: Optional[Iterable[Tuple[int, int, int]]] = None) -> None:
+        """Load all sprite PNG and JSON metadata files.
+
+        Args:
+            taker_palette: Optional colors to pre-tint taker sprites with
+                (see pretint). By default nothing is pre-tinted.
+        """
         if self._loaded:
             return
 
         if not ASSETS_DIR.exists():
             return
 
-        for json_path in ASSETS_DIR.glob("*.json"):
-            sprite_name = json_path.stem
-            png_path = ASSETS_DIR / f"{sprite_name}.png"
+        # Read metadata and decode PNGs in parallel (image.load releases the
+        # GIL while decoding); convert_alpha needs the display, so it stays
+        # on this thread
+        json_paths = list(ASSETS_DIR.glob("*.json"))
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(_read_sprite_files, json_paths))
 
-            # Load metadata
-            try:
-                with open(json_path) as f:
-                    meta = json.load(f)
-                self._metadata[sprite_name] = meta
-            except (json.JSONDecodeError, OSError):
+        loaded: Dict[str, pygame.Surface] = {}
+        for sprite_name, meta, image in results:
+            if meta is None:
                 continue
+            self._metadata[sprite_name] = meta
+            if image is not None:
+                loaded[sprite_name] = image.convert_alpha()
+
+        self._atlas, self._rects = self._pack_atlas(loaded)
+
+        # Split the whole atlas into grey/detail layers in one vectorized
+        # pass; taker sprites take their layers as subsurfaces of these
+        grey_atlas, detail_atlas = self._split_grey_layers(self._atlas)
+
+        for sprite_name in loaded:
+            surface = self._atlas.subsurface(self._rects[sprite_name])
+            self._surfaces[sprite_name] = surface
 
-            # Load PNG surface
-            if png_path.exists():
-                try:
-                    surface = pygame.image.load(str(png_path)).convert_alpha()
-                    self._surfaces[sprite_name] = surface
-                except pygame.error:
-                    continue
+            w_pixels, h_pixels = surface.get_size()
+            self._dimensions[sprite_name] = (
+                max(1, w_pixels // CELL_WIDTH),
+                max(1, h_pixels // CELL_HEIGHT),
+            )
+
+            if self._metadata[sprite_name].get("color_role") == "taker":
+                rect = self._rects[sprite_name]
+                self._tint_layers[sprite_name] = (
+                    grey_atlas.subsurface(rect),
+                    detail_atlas.subsurface(rect),
+                )
 
         self._loaded = True
 
+        if taker_palette is not None:
+            self.pretint(taker_palette)
+
+    def pretint(self, colors: Iterable[Tuple[int, int, int]]) -> None:
+        """Tint taker sprites with the given colors ahead of drawing.
+
+        The results go into the colored cache, so they count against
+        COLORED_CACHE_SIZE; tinting stops once the cache is full.
+        """
+        for color in colors:
+            color = tuple(color[:3])
+            for sprite_name in self._tint_layers:
+                if len(self._colored_cache) >= COLORED_CACHE_SIZE:
+                    return
+                self._get_colored_surface(sprite_name, color)
+
+    def get_source_palette(self) -> List[Tuple[int, int, int]]:
+        """Get the distinct source colors declared in the sprite metadata."""
+        palette = []
+        for meta in self._metadata.values():
+            source_color = meta.get("source_color")
+            if meta.get("color_role") != "source" or not isinstance(source_color, list):
+                continue
+            color = tuple(source_color[:3])
+            if len(color) == 3 and color not in palette:
+                palette.append(color)
+        return palette
+
+    def _pack_atlas(
+        self,
+        surfaces: Dict[str, pygame.Surface],
+    ) -> Tuple[pygame.Surface, Dict[str, pygame.Rect]]:
+        """Pack sprite surfaces into a single atlas surface.
+
+        Uses a simple shelf packer: sprites are placed left to right in
+        rows, tallest first, starting a new row when one is full.
+
+        Args:
+            surfaces: Sprite surfaces keyed by sprite name
+
+        Returns:
+            Tuple of (atlas surface, rect of each sprite within the atlas)
+        """
+        atlas_width = max([ATLAS_WIDTH] + [s.get_width() for s in surfaces.values()])
+        order = sorted(
+            surfaces,
+            key=lambda n: (surfaces[n].get_height(), surfaces[n].get_width()),
+            reverse=True,
+        )
+
+        rects: Dict[str, pygame.Rect] = {}
+        x = y = shelf_height = 0
+        for name in order:
+            w, h = surfaces[name].get_size()
+            if x + w > atlas_width:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            rects[name] = pygame.Rect(x, y, w, h)
+            x += w
+            shelf_height = max(shelf_height, h)
+
+        atlas_height = max(1, y + shelf_height)
+        atlas = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA).convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        for name, rect in rects.items():
+            # The atlas starts cleared, so an additive blit copies pixels exactly
+            atlas.blit(surfaces[name], rect, special_flags=pygame.BLEND_RGBA_ADD)
+
+        return atlas, rects
+
     def get_sprite_info(self, sprite_name: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a sprite."""
         self.load_all()
@@ -63,15 +182,7 @@ class PixelSpriteLoader:
 
     def get_sprite_dimensions(self, sprite_name: str) -> Tuple[int, int]:
         """Get sprite dimensions in cells (width_cells, height_cells)."""
-        self.load_all()
-        surface = self._surfaces.get(sprite_name)
-        if surface is None:
-            return (2, 1)  # Default item size
-
-        w_pixels, h_pixels = surface.get_size()
-        w_cells = max(1, w_pixels // CELL_WIDTH)
-        h_cells = max(1, h_pixels // CELL_HEIGHT)
-        return (w_cells, h_cells)
+        return self._dimensions.get(sprite_name, (2, 1))  # Default item size
 
     def get_sprite_surface(
         self,
@@ -87,71 +198,120 @@ class PixelSpriteLoader:
         Returns:
             pygame Surface or None if sprite not found
         """
-        self.load_all()
-
         base_surface = self._surfaces.get(sprite_name)
         if base_surface is None:
             return None
 
-        # Check if this sprite needs color transformation
-        meta = self._metadata.get(sprite_name, {})
-        color_role = meta.get("color_role")
-
-        # If no color transformation needed, return base surface
-        if color_role != "taker" or effective_color is None:
+        # Only taker sprites (which have tint layers) are color-transformed
+        if effective_color is None or sprite_name not in self._tint_layers:
             return base_surface
 
-        # Check cache
+        return self._get_colored_surface(sprite_name, effective_color)
+
+    def get_item_render(
+        self,
+        sprite_name: str,
+        effective_color: Optional[Tuple[int, int, int]] = None,
+    ) -> Tuple[Optional[pygame.Surface], int, int]:
+        """Get a sprite surface and its size in cells in one lookup.
+
+        Args:
+            sprite_name: Name of the sprite (filename without extension)
+            effective_color: RGB color for grey multiplication (for takers)
+
+        Returns:
+            Tuple of (surface, width_cells, height_cells)
+            Returns (None, 2, 1) if sprite not found
+        """
+        base_surface = self._surfaces.get(sprite_name)
+        if base_surface is None:
+            return (None, 2, 1)
+
+        w_cells, h_cells = self._dimensions[sprite_name]
+        if effective_color is None or sprite_name not in self._tint_layers:
+            return (base_surface, w_cells, h_cells)
+
+        return (self._get_colored_surface(sprite_name, effective_color), w_cells, h_cells)
+
+    def _get_colored_surface(
+        self,
+        sprite_name: str,
+        effective_color: Tuple[int, int, int],
+    ) -> pygame.Surface:
+        """Get a taker sprite tinted with a color, using the cache."""
         cache_key = (sprite_name, tuple(effective_color))
-        if cache_key in self._colored_cache:
-            return self._colored_cache[cache_key]
+        colored = self._colored_cache.get(cache_key)
+        if colored is not None:
+            self._colored_cache.move_to_end(cache_key)
+            return colored
 
         # Apply grey multiplication coloring
-        colored = self._apply_grey_multiplication(base_surface, effective_color)
+        grey_layer, detail_layer = self._tint_layers[sprite_name]
+        colored = self._multiply_tint(grey_layer, detail_layer, effective_color)
         self._colored_cache[cache_key] = colored
+        if len(self._colored_cache) > COLORED_CACHE_SIZE:
+            self._colored_cache.popitem(last=False)
         return colored
 
-    def _apply_grey_multiplication(
+    def _split_grey_layers(
         self,
         surface: pygame.Surface,
-        color: Tuple[int, int, int],
-    ) -> pygame.Surface:
-        """Apply grey multiplication coloring to a surface.
+    ) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Split a surface into its grey pixels and everything else.
 
-        Finds pixels where R == G == B (perfect grey) and multiplies
-        the grey value by the target color.
+        Pixels where R == G == B (perfect grey) and alpha > 0 go to the
+        grey layer; all other pixels go to the detail layer. Pixels not
+        in a layer are fully cleared to (0, 0, 0, 0) so the two layers
+        can be recombined with an additive blit.
 
         Args:
             surface: Source surface
-            color: Target RGB color
 
         Returns:
-            New surface with color transformation applied
+            Tuple of (grey_layer, detail_layer)
         """
-        # Create a copy of the surface
-        result = surface.copy()
-        width, height = result.get_size()
-
-        # Lock surface for pixel access
-        result.lock()
-
-        for y in range(height):
-            for x in range(width):
-                r, g, b, a = result.get_at((x, y))
-
-                # Check if pixel is grey (R == G == B)
-                if r == g == b and a > 0:
-                    # Grey value (0-255)
-                    grey = r
+        grey_layer = surface.copy()
+        detail_layer = surface.copy()
+
+        # Pixel views lock the surface until they are released
+        rgb = pygame.surfarray.pixels3d(grey_layer)
+        alpha = pygame.surfarray.pixels_alpha(grey_layer)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        mask = (r == g) & (g == b) & (alpha > 0)
+        rgb[~mask] = 0
+        alpha[~mask] = 0
+        del rgb, alpha
+
+        rgb = pygame.surfarray.pixels3d(detail_layer)
+        alpha = pygame.surfarray.pixels_alpha(detail_layer)
+        rgb[mask] = 0
+        alpha[mask] = 0
+        del rgb, alpha
+
+        return grey_layer, detail_layer
+
+    def _multiply_tint(
+        self,
+        grey_layer: pygame.Surface,
+        detail_layer: pygame.Surface,
+        color: Tuple[int, int, int],
+    ) -> pygame.Surface:
+        """Apply grey multiplication coloring using SDL's multiply blend.
 
-                    # Multiply grey by color and normalize
-                    new_r = min(255, (grey * color[0]) // 255)
-                    new_g = min(255, (grey * color[1]) // 255)
-                    new_b = min(255, (grey * color[2]) // 255)
+        Multiplies the grey layer by the target color, then adds the
+        untouched detail layer back on top.
 
-                    result.set_at((x, y), (new_r, new_g, new_b, a))
+        Args:
+            grey_layer: Grey pixels of the sprite
+            detail_layer: Non-grey pixels of the sprite
+            color: Target RGB color
 
-        result.unlock()
+        Returns:
+            New surface with color transformation applied
+        """
+        result = grey_layer.copy()
+        result.fill((*color[:3], 255), special_flags=pygame.BLEND_RGBA_MULT)
+        result.blit(detail_layer, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
         return result
 
     def has_sprite(self, sprite_name: str) -> bool:
@@ -169,6 +329,40 @@ class PixelSpriteLoader:
         self._colored_cache.clear()
 
 
+def _read_sprite_files(
+    json_path: Path,
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[pygame.Surface]]:
+    """Read a sprite's JSON metadata and decode its PNG, if any.
+
+    Args:
+        json_path: Path to the sprite's JSON metadata file
+
+    Returns:
+        Tuple of (sprite_name, metadata, unconverted surface). Metadata is
+        None if the JSON could not be read; the surface is None if the PNG
+        is missing or could not be decoded.
+    """
+    sprite_name = json_path.stem
+    png_path = ASSETS_DIR / f"{sprite_name}.png"
+
+    # Load metadata
+    try:
+        with open(json_path) as f:
+            meta = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return (sprite_name, None, None)
+
+    # Load PNG surface
+    image = None
+    if png_path.exists():
+        try:
+            image = pygame.image.load(str(png_path))
+        except pygame.error:
+            pass
+
+    return (sprite_name, meta, image)
+
+
 # Global singleton instance
 _loader: Optional[PixelSpriteLoader] = None
 
@@ -181,6 +375,11 @@ def get_loader() -> PixelSpriteLoader:
     return _loader
 
 
+def preload() -> None:
+    """Load all pixel sprites (requires an initialized display)."""
+    get_loader().load_all()
+
+
 def get_item_sprite(
     good_type: str,
     effective_color: Optional[Tuple[int, int, int]] = None,
@@ -196,21 +395,9 @@ def get_item_sprite(
         Returns (None, 2, 1) if sprite not found
     """
     loader = get_loader()
-
-    # Convert good_type to sprite name (replace spaces with underscores)
-    sprite_name = good_type.lower().replace(" ", "_")
-
-    surface = loader.get_sprite_surface(sprite_name, effective_color)
-    if surface is None:
-        return (None, 2, 1)
-
-    w_cells, h_cells = loader.get_sprite_dimensions(sprite_name)
-    return (surface, w_cells, h_cells)
-
-
-def good_type_to_sprite_name(good_type: str) -> str:
-    """Convert a good_type to its sprite name."""
-    return good_type.lower().replace(" ", "_")
+    loader.load_all()
+    sprite_name = good_type_to_sprite_name(good_type)
+    return loader.get_item_render(sprite_name, effective_color)
 
 
 def has_pixel_sprite(good_type: str) -> bool:
@@ -1,13 +1,15 @@
 """Sprite definitions and Unicode character mappings for all entity types."""
 
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from config import Color
+from rendering.sprite_names import good_type_to_sprite_name
 
 
 # Set of all available PNG item sprites (filename stems without .png)
 # Items in this set will use pixel sprites instead of Unicode
-PIXEL_SPRITE_ITEMS = {
+PIXEL_SPRITE_ITEMS = frozenset({
     "alum_found",
     "ash_glaze",
     "barley_stalks",
@@ -115,22 +117,26 @@ PIXEL_SPRITE_ITEMS = {
     "wood_red_dye",
     "yellow_clay",
     "yellow_dye",
-}
+})
+
+
+@lru_cache(maxsize=1024)
+def _pixel_sprite_name(good_type: str) -> Optional[str]:
+    """Resolve (and memoize) the pixel sprite name for a good_type."""
+    sprite_name = good_type_to_sprite_name(good_type)
+    if sprite_name in PIXEL_SPRITE_ITEMS:
+        return sprite_name
+    return None
 
 
 def has_pixel_sprite(good_type: str) -> bool:
     """Check if a good_type has a pixel sprite available."""
-    # Normalize good_type to sprite name format
-    sprite_name = good_type.lower().replace(" ", "_")
-    return sprite_name in PIXEL_SPRITE_ITEMS
+    return _pixel_sprite_name(good_type) is not None
 
 
 def get_pixel_sprite_name(good_type: str) -> Optional[str]:
     """Get the pixel sprite name for a good_type, or None if not available."""
-    sprite_name = good_type.lower().replace(" ", "_")
-    if sprite_name in PIXEL_SPRITE_ITEMS:
-        return sprite_name
-    return None
+    return _pixel_sprite_name(good_type)
 
 
 # Double-line Unicode box-drawing characters for workshop walls
@@ -184,6 +190,13 @@ MONSTER_COLORS = {
     "troll": {"player": Color.PLAYER_TROLL, "other": Color.OTHER_TROLL},
 }
 
+# (monster_type, is_player) -> (character, color), flattened from the above
+_MONSTER_TABLE = {
+    (monster_type, is_player): (MONSTER_SPRITES[monster_type][key], MONSTER_COLORS[monster_type][key])
+    for monster_type in MONSTER_SPRITES
+    for is_player, key in ((True, "player"), (False, "other"))
+}
+
 
 # Item sprites (2x1) - matched by type tags or name
 # Format: (pattern, default_color)
@@ -299,6 +312,21 @@ ITEM_SPRITE_MAP = {
     "brazier": ("{}", (255, 100, 50)),
 }
 
+# (name, color) for every ITEM_SPRITE_MAP entry with a fixed color, in map
+# order; used to pick the dye color out of a dyed item's name
+_ITEM_NAME_COLORS = tuple(
+    (name, color) for name, (_, color) in ITEM_SPRITE_MAP.items() if color
+)
+
+# Clay colors by name token, checked in order
+_CLAY_COLORS = (
+    ("red", Color.ITEM_CLAY_RED),
+    ("yellow", Color.ITEM_CLAY_YELLOW),
+    ("blue", Color.ITEM_CLAY_BLUE),
+    ("white", Color.ITEM_CLAY_WHITE),
+    ("black", Color.ITEM_CLAY_BLACK),
+)
+
 
 # Workshop sprites (4x4)
 WORKSHOP_PATTERNS = {
@@ -352,6 +380,20 @@ WORKSHOP_PATTERNS = {
 +--+""",
 }
 
+# Workshop type for a workshop's primary applied skill
+_SKILL_TO_WORKSHOP_TYPE = {
+    "spinning": "spinning",
+    "weaving": "weaving",
+    "dyeing": "dyeing",
+    "sericulture": "sericulture",
+    "blacksmithing": "smithing",
+    "casting": "casting",
+    "pottery": "pottery",
+    "milling": "milling",
+    "confectionery": "confectionery",
+    "carpentry": "carpentry",
+}
+
 WORKSHOP_COLORS = {
     "spinning": Color.WORKSHOP_SPINNING,
     "weaving": Color.WORKSHOP_WEAVING,
@@ -374,6 +416,23 @@ GATHERING_SPOT_PATTERN = """....
 .XX.
 ...."""
 
+# Gathering spot pattern for each center icon
+_GATHERING_SPOT_VARIANTS = {
+    center: GATHERING_SPOT_PATTERN.replace("XX", center)
+    for center in ("()", "@@", "{{", "<>", "**")
+}
+
+# (keyword, center icon, color) for gathering spots, checked in order
+_GATHERING_SPOT_KEYWORDS = (
+    ("cotton", "()", Color.ITEM_COTTON),
+    ("silk", "@@", Color.ITEM_SILK),
+    ("cocoon", "@@", Color.ITEM_SILK),
+    ("grain", "{{", Color.ITEM_GRAIN),
+    ("wheat", "{{", Color.ITEM_GRAIN),
+    ("rice", "{{", Color.ITEM_GRAIN),
+    ("clay", "<>", Color.WORKSHOP_POTTERY),
+)
+
 
 # Wagon sprites (3x2)
 WAGON_EMPTY = """[==]
@@ -408,12 +467,11 @@ def get_monster_sprite_def(
     Returns:
         Tuple of (character, color)
     """
-    key = "player" if is_player else "other"
-
-    sprites = MONSTER_SPRITES.get(monster_type, MONSTER_SPRITES["goblin"])
-    colors = MONSTER_COLORS.get(monster_type, MONSTER_COLORS["goblin"])
-
-    return sprites[key], colors[key]
+    is_player = bool(is_player)
+    sprite_def = _MONSTER_TABLE.get((monster_type, is_player))
+    if sprite_def is None:
+        sprite_def = _MONSTER_TABLE[("goblin", is_player)]
+    return sprite_def
 
 
 def get_item_pixel_sprite_name(metadata: Dict[str, Any]) -> Optional[str]:
@@ -440,49 +498,50 @@ def get_item_sprite_def(metadata: Dict[str, Any]) -> Tuple[str, Tuple[int, int,
     """
     good_type = metadata.get("good_type", "").lower()
     type_tags = metadata.get("type_tags", [])
+    return _item_sprite_def(good_type, tuple(type_tags))
+
 
+@lru_cache(maxsize=1024)
+def _item_sprite_def(
+    good_type: str,
+    type_tags: Tuple[str, ...],
+) -> Tuple[str, Tuple[int, int, int]]:
+    """Resolve (and memoize) an item sprite from its lowercased good_type and tags."""
     # Check type tags first (more specific)
     for tag in type_tags:
-        tag_lower = tag.lower()
-        if tag_lower in ITEM_SPRITE_MAP:
-            pattern, color = ITEM_SPRITE_MAP[tag_lower]
+        entry = ITEM_SPRITE_MAP.get(tag.lower())
+        if entry is not None:
+            pattern, color = entry
             if color is None:
-                color = _derive_item_color(metadata, good_type)
+                color = _derive_item_color(good_type)
             return pattern, color
 
     # Check good type name
     for key, (pattern, color) in ITEM_SPRITE_MAP.items():
         if key in good_type:
             if color is None:
-                color = _derive_item_color(metadata, good_type)
+                color = _derive_item_color(good_type)
             return pattern, color
 
     # Default
     return "**", Color.ITEM_DEFAULT
 
 
-def _derive_item_color(metadata: Dict, good_type: str) -> Tuple[int, int, int]:
-    """Derive color from item metadata when not explicitly mapped."""
+def _derive_item_color(good_type: str) -> Tuple[int, int, int]:
+    """Derive an item's color from its good_type when not explicitly mapped."""
     good_type_lower = good_type.lower()
 
     # Dyed fabric - extract dye color
     if "dyed" in good_type_lower:
-        for dye_name, (_, color) in ITEM_SPRITE_MAP.items():
-            if dye_name in good_type_lower and color:
+        for dye_name, color in _ITEM_NAME_COLORS:
+            if dye_name in good_type_lower:
                 return color
         return Color.ITEM_FABRIC
 
     # Clay types
-    if "red" in good_type_lower:
-        return Color.ITEM_CLAY_RED
-    if "yellow" in good_type_lower:
-        return Color.ITEM_CLAY_YELLOW
-    if "blue" in good_type_lower:
-        return Color.ITEM_CLAY_BLUE
-    if "white" in good_type_lower:
-        return Color.ITEM_CLAY_WHITE
-    if "black" in good_type_lower:
-        return Color.ITEM_CLAY_BLACK
+    for token, color in _CLAY_COLORS:
+        if token in good_type_lower:
+            return color
 
     return Color.ITEM_DEFAULT
 
@@ -510,75 +569,85 @@ def generate_workshop_pattern(
     Returns:
         Multi-line pattern string with Unicode box-drawing walls
     """
-    interior_icon = WORKSHOP_INTERIOR_ICONS.get(workshop_type, WORKSHOP_INTERIOR_ICONS["default"])
-
-    # Build door cell lookup
-    door_cells = set()
-    for door in doors:
-        side = door.get("side", "bottom")
-        offset = door.get("offset", 0)
-        door_width = door.get("width", 2)
-
-        for i in range(door_width):
-            if side == "top":
-                door_cells.add((offset + i, 0))
-            elif side == "bottom":
-                door_cells.add((offset + i, height - 1))
-            elif side == "left":
-                door_cells.add((0, offset + i))
-            elif side == "right":
-                door_cells.add((width - 1, offset + i))
-
-    # Build spot lookups (positions are relative to workshop top-left)
-    input_cells = set()
-    for spot in (input_spots or []):
-        input_cells.add((spot.get("x", 0), spot.get("y", 0)))
-
-    output_cells = set()
-    for spot in (output_spots or []):
-        output_cells.add((spot.get("x", 0), spot.get("y", 0)))
+    # Canonical, hashable form of the layout (positions are relative to
+    # workshop top-left)
+    door_specs = tuple(
+        (door.get("side", "bottom"), door.get("offset", 0), door.get("width", 2))
+        for door in doors
+    )
+    input_cells = frozenset((spot.get("x", 0), spot.get("y", 0)) for spot in (input_spots or []))
+    output_cells = frozenset((spot.get("x", 0), spot.get("y", 0)) for spot in (output_spots or []))
 
     crafting_cell = None
     if crafting_spot:
         crafting_cell = (crafting_spot.get("x", 0), crafting_spot.get("y", 0))
 
-    rows = []
-    for y in range(height):
-        row = ""
-        for x in range(width):
-            is_door = (x, y) in door_cells
-            is_corner = (x == 0 or x == width - 1) and (y == 0 or y == height - 1)
-            is_top = y == 0
-            is_bottom = y == height - 1
-            is_left = x == 0
-            is_right = x == width - 1
-
-            if is_door:
-                row += " "
-            elif is_corner:
-                if x == 0 and y == 0:
-                    row += WALL_CHARS["top_left"]
-                elif x == width - 1 and y == 0:
-                    row += WALL_CHARS["top_right"]
-                elif x == 0 and y == height - 1:
-                    row += WALL_CHARS["bottom_left"]
-                else:
-                    row += WALL_CHARS["bottom_right"]
-            elif is_top or is_bottom:
-                row += WALL_CHARS["horizontal"]
-            elif is_left or is_right:
-                row += WALL_CHARS["vertical"]
-            elif (x, y) == crafting_cell:
-                row += SPOT_MARKERS["crafting"]
-            elif (x, y) in input_cells:
-                row += SPOT_MARKERS["input"]
-            elif (x, y) in output_cells:
-                row += SPOT_MARKERS["output"]
-            else:
-                # Interior cell
-                row += interior_icon
-
-        rows.append(row)
+    return _workshop_pattern(
+        width, height, workshop_type, door_specs, input_cells, output_cells, crafting_cell
+    )
+
+
+@lru_cache(maxsize=256)
+def _workshop_pattern(
+    width: int,
+    height: int,
+    workshop_type: str,
+    door_specs: Tuple[Tuple[str, int, int], ...],
+    input_cells: FrozenSet[Tuple[int, int]],
+    output_cells: FrozenSet[Tuple[int, int]],
+    crafting_cell: Optional[Tuple[int, int]],
+) -> str:
+    """Build (and memoize) a workshop pattern from its canonical layout."""
+    interior_icon = WORKSHOP_INTERIOR_ICONS.get(workshop_type, WORKSHOP_INTERIOR_ICONS["default"])
+
+    # Build door cell lookup
+    door_cells = set()
+    for side, offset, door_width in door_specs:
+        span = range(offset, offset + door_width)
+        if side == "top":
+            door_cells.update((x, 0) for x in span)
+        elif side == "bottom":
+            door_cells.update((x, height - 1) for x in span)
+        elif side == "left":
+            door_cells.update((0, y) for y in span)
+        elif side == "right":
+            door_cells.update((width - 1, y) for y in span)
+
+    # Wall/interior template rows (a 1-wide workshop is just its left wall)
+    def wall_row(left: str, fill: str, right: str) -> str:
+        if width <= 1:
+            return left * width
+        return left + fill * (width - 2) + right
+
+    top = wall_row(WALL_CHARS["top_left"], WALL_CHARS["horizontal"], WALL_CHARS["top_right"])
+    bottom = wall_row(WALL_CHARS["bottom_left"], WALL_CHARS["horizontal"], WALL_CHARS["bottom_right"])
+    middle = wall_row(WALL_CHARS["vertical"], interior_icon, WALL_CHARS["vertical"])
+    if height <= 1:
+        rows = [top] * height
+    else:
+        rows = [top] + [middle] * (height - 2) + [bottom]
+
+    # Overlay spots and doors, lowest precedence first (doors win over
+    # walls and spots; spots only show on interior cells)
+    overlays = []
+    for cell in output_cells:
+        overlays.append((cell, SPOT_MARKERS["output"], True))
+    for cell in input_cells:
+        overlays.append((cell, SPOT_MARKERS["input"], True))
+    if crafting_cell is not None:
+        overlays.append((crafting_cell, SPOT_MARKERS["crafting"], True))
+    for cell in door_cells:
+        overlays.append((cell, " ", False))
+
+    if overlays:
+        grid = [list(row) for row in rows]
+        for (x, y), char, interior_only in overlays:
+            if interior_only:
+                if 0 < x < width - 1 and 0 < y < height - 1:
+                    grid[y][x] = char
+            elif 0 <= x < width and 0 <= y < height:
+                grid[y][x] = char
+        rows = ["".join(row) for row in grid]
 
     return "\n".join(rows)
 
@@ -618,19 +687,7 @@ def get_workshop_sprite_def(
     # Check primary applied skill from recipe
     elif "primary_applied_skill" in metadata:
         skill = metadata["primary_applied_skill"].lower()
-        skill_to_type = {
-            "spinning": "spinning",
-            "weaving": "weaving",
-            "dyeing": "dyeing",
-            "sericulture": "sericulture",
-            "blacksmithing": "smithing",
-            "casting": "casting",
-            "pottery": "pottery",
-            "milling": "milling",
-            "confectionery": "confectionery",
-            "carpentry": "carpentry",
-        }
-        workshop_type = skill_to_type.get(skill, "default")
+        workshop_type = _SKILL_TO_WORKSHOP_TYPE.get(skill, "default")
 
     if workshop_type is None:
         workshop_type = "default"
@@ -672,24 +729,11 @@ def get_gathering_spot_sprite_def(metadata: Dict[str, Any]) -> Tuple[str, Tuple[
     good_type = good_type.lower()
 
     # Determine center icon based on good type
-    if "cotton" in good_type:
-        center = "()"
-        color = Color.ITEM_COTTON
-    elif "silk" in good_type or "cocoon" in good_type:
-        center = "@@"
-        color = Color.ITEM_SILK
-    elif "grain" in good_type or "wheat" in good_type or "rice" in good_type:
-        center = "{{"
-        color = Color.ITEM_GRAIN
-    elif "clay" in good_type:
-        center = "<>"
-        color = Color.WORKSHOP_POTTERY
-    else:
-        center = "**"
-        color = Color.GATHERING_SPOT
+    for keyword, center, color in _GATHERING_SPOT_KEYWORDS:
+        if keyword in good_type:
+            return _GATHERING_SPOT_VARIANTS[center], color
 
-    pattern = GATHERING_SPOT_PATTERN.replace("XX", center)
-    return pattern, color
+    return _GATHERING_SPOT_VARIANTS["**"], Color.GATHERING_SPOT
 
 
 def get_wagon_sprite_def(metadata: Dict[str, Any]) -> Tuple[str, Tuple[int, int, int]]:
@@ -714,6 +758,21 @@ def get_delivery_sprite_def() -> Tuple[str, Tuple[int, int, int]]:
     return DELIVERY_PATTERN, Color.DELIVERY
 
 
+# Sprite definition builders by entity kind: (entity, metadata, player_id) -> (pattern, color)
+_KIND_HANDLERS = {
+    "monster": lambda entity, metadata, player_id: get_monster_sprite_def(
+        metadata.get("monster_type", "goblin"), entity.get("owner_id") == player_id
+    ),
+    "item": lambda entity, metadata, player_id: get_item_sprite_def(metadata),
+    "workshop": lambda entity, metadata, player_id: get_workshop_sprite_def(
+        metadata, entity.get("width", 4), entity.get("height", 4)
+    ),
+    "gathering_spot": lambda entity, metadata, player_id: get_gathering_spot_sprite_def(metadata),
+    "wagon": lambda entity, metadata, player_id: get_wagon_sprite_def(metadata),
+    "delivery": lambda entity, metadata, player_id: get_delivery_sprite_def(),
+}
+
+
 def get_sprite_def(entity: Dict[str, Any], player_id: Optional[str] = None) -> Tuple[str, Tuple[int, int, int]]:
     """Get sprite definition for any entity.
 
@@ -727,33 +786,11 @@ def get_sprite_def(entity: Dict[str, Any], player_id: Optional[str] = None) -> T
     metadata = entity.get("metadata", {})
     kind = metadata.get("kind", "unknown")
 
-    if kind == "monster":
-        monster_type = metadata.get("monster_type", "goblin")
-        is_player = entity.get("owner_id") == player_id
-        return get_monster_sprite_def(monster_type, is_player)
-
-    elif kind == "item":
-        return get_item_sprite_def(metadata)
+    handler = _KIND_HANDLERS.get(kind)
+    if handler is not None:
+        return handler(entity, metadata, player_id)
 
-    elif kind == "workshop":
-        width = entity.get("width", 4)
-        height = entity.get("height", 4)
-        return get_workshop_sprite_def(metadata, width, height)
-
-    elif kind == "gathering_spot":
-        return get_gathering_spot_sprite_def(metadata)
-
-    elif kind == "wagon":
-        return get_wagon_sprite_def(metadata)
-
-    elif kind == "delivery":
-        return get_delivery_sprite_def()
-
-    elif kind in OTHER_SPRITES:
-        return OTHER_SPRITES[kind]
-
-    else:
-        return ("?", Color.GRAY)
+    return OTHER_SPRITES.get(kind, ("?", Color.GRAY))
 
 
 def get_item_color(metadata: Dict[str, Any]) -> Tuple[int, int, int]:
@@ -0,0 +1,9 @@
+"""Sprite name normalization shared by the sprite catalog and the pixel loader."""
+
+import sys
+
+
+def good_type_to_sprite_name(good_type: str) -> str:
+    """Convert a good_type to its (interned) sprite name."""
+    # Replace spaces with underscores
+    return sys.intern(good_type.lower().replace(" ", "_"))
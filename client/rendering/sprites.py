@@ -1,17 +1,59 @@
 """Sprite factory for creating and managing game sprites."""
 
-import sys
-import os
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple, Union
 
-# Add pyunicodegame to path
-sys.path.insert(0, os.path.expanduser("~/Documents/github/pyunicodegame/src"))
-
 import pyunicodegame
 
-from config import SPRITE_LERP_SPEED
+from config import LIGHT_CONFIGS, SPRITE_LERP_SPEED, LightConfig
 from rendering.sprite_catalog import get_sprite_def, get_item_pixel_sprite_name
-from rendering.pixel_sprite_loader import get_loader as get_pixel_loader
+from rendering.pixel_sprite_loader import COLORED_CACHE_SIZE, get_loader as get_pixel_loader
+
+# Shared stand-in for missing metadata, so lookups don't allocate a dict
+_EMPTY_META = MappingProxyType({})
+
+# Entity kinds that always carry a light -> their light config
+_KIND_LIGHT_CONFIGS = {
+    kind: LIGHT_CONFIGS[kind] for kind in ("gathering_spot", "signpost", "commune")
+}
+
+
+def _light_config(entity: Dict) -> Optional[LightConfig]:
+    """Get the light config an entity should have, or None for no light."""
+    metadata = entity.get("metadata") or _EMPTY_META
+    kind = metadata.get("kind")
+    if kind == "workshop":
+        return LIGHT_CONFIGS["workshop_active"] if metadata.get("is_crafting") else None
+    return _KIND_LIGHT_CONFIGS.get(kind)
+
+
+# Appearance key builders by entity kind: (entity, metadata) -> key tuple of
+# the fields that kind's sprite depends on. Other kinds key on kind alone.
+_CACHE_KEY_BUILDERS = {
+    "monster": lambda entity, metadata: (
+        "monster", entity.get("owner_id"), metadata.get("monster_type")
+    ),
+    "item": lambda entity, metadata: (
+        "item", metadata.get("good_type"), metadata.get("effective_color")
+    ),
+    "workshop": lambda entity, metadata: ("workshop", metadata.get("is_crafting")),
+    "wagon": lambda entity, metadata: ("wagon", bool(metadata.get("loaded_item_ids"))),
+}
+
+
+class _SpriteRecord:
+    """Bookkeeping kept alongside each live sprite."""
+
+    __slots__ = ("cache_key", "pos", "sprite_def")
+
+    def __init__(self, cache_key: Tuple, pos: Tuple[Any, Any], sprite_def: Optional[Tuple[str, Any]]):
+        # Appearance key from SpriteFactory._cache_key
+        self.cache_key = cache_key
+        # Last position the sprite was moved to
+        self.pos = pos
+        # (pattern, color) a Unicode sprite was built with; None for pixel sprites
+        self.sprite_def = sprite_def
 
 
 class SpriteFactory:
@@ -30,12 +72,18 @@ class SpriteFactory:
         # Sprite storage: entity_id -> sprite (can be Sprite or PixelSprite)
         self.sprites: Dict[str, Union[pyunicodegame.Sprite, pyunicodegame.PixelSprite]] = {}
 
-        # Track entity metadata for update detection
-        self._entity_cache: Dict[str, Dict] = {}
+        # Per-sprite bookkeeping for update detection: entity_id -> record
+        self._records: Dict[str, _SpriteRecord] = {}
 
         # Initialize pixel sprite loader
         self._pixel_loader = get_pixel_loader()
 
+        # (sprite_name, effective_color) -> PixelFrame, or None if unusable,
+        # least recently used first; bounded like the loader's colored cache
+        self._frame_cache: "OrderedDict[Tuple[str, Optional[Tuple]], Optional[pyunicodegame.PixelFrame]]" = (
+            OrderedDict()
+        )
+
     def set_player_id(self, player_id: str):
         """Set the player ID for ownership detection."""
         self.player_id = player_id
@@ -53,7 +101,7 @@ class SpriteFactory:
             The created sprite (unicode or pixel)
         """
         eid = entity["id"]
-        metadata = entity.get("metadata", {})
+        metadata = entity.get("metadata") or _EMPTY_META
         kind = metadata.get("kind")
 
         # Check if this is an item with a pixel sprite
@@ -61,7 +109,9 @@ class SpriteFactory:
             sprite = self._try_create_pixel_sprite(entity)
             if sprite is not None:
                 self.sprites[eid] = sprite
-                self._entity_cache[eid] = self._cache_key(entity)
+                self._records[eid] = _SpriteRecord(
+                    self._cache_key(entity), (entity["x"], entity["y"]), None
+                )
                 self.game_window.add_sprite(sprite)
                 return sprite
 
@@ -77,7 +127,9 @@ class SpriteFactory:
         )
 
         self.sprites[eid] = sprite
-        self._entity_cache[eid] = self._cache_key(entity)
+        self._records[eid] = _SpriteRecord(
+            self._cache_key(entity), (entity["x"], entity["y"]), (pattern, color)
+        )
         self.game_window.add_sprite(sprite)
 
         return sprite
@@ -94,7 +146,7 @@ class SpriteFactory:
         Returns:
             PixelSprite if available, None otherwise
         """
-        metadata = entity.get("metadata", {})
+        metadata = entity.get("metadata") or _EMPTY_META
         good_type = metadata.get("good_type", "")
 
         # Check if pixel sprite exists for this good_type
@@ -102,14 +154,42 @@ class SpriteFactory:
         if sprite_name is None:
             return None
 
-        # Get effective_color from metadata (for color inheritance)
+        # effective_color (for color inheritance) is already an RGB tuple;
+        # GameState normalizes it as entities arrive
         effective_color = metadata.get("effective_color")
-        if effective_color is not None and isinstance(effective_color, (list, tuple)):
-            effective_color = tuple(effective_color[:3])
-        else:
-            effective_color = None
 
-        # Get the sprite surface
+        frame = self._get_pixel_frame(sprite_name, effective_color)
+        if frame is None:
+            return None
+
+        sprite = pyunicodegame.PixelSprite([frame])
+        sprite.x = entity["x"]
+        sprite.y = entity["y"]
+        sprite._teleport_pending = True
+        sprite.lerp_speed = SPRITE_LERP_SPEED
+
+        return sprite
+
+    def _get_pixel_frame(
+        self,
+        sprite_name: str,
+        effective_color: Optional[Tuple[int, int, int]],
+    ) -> Optional[pyunicodegame.PixelFrame]:
+        """Get the shared pixel frame for a sprite name and color.
+
+        Frames are immutable, so every item with the same sprite and color
+        reuses one. Misaligned surfaces are remembered as None.
+
+        Returns:
+            PixelFrame, or None if the surface is missing or doesn't align
+            with the cell grid
+        """
+        key = (sprite_name, effective_color)
+        frame_cache = self._frame_cache
+        if key in frame_cache:
+            frame_cache.move_to_end(key)
+            return frame_cache[key]
+
         surface = self._pixel_loader.get_sprite_surface(sprite_name, effective_color)
         if surface is None:
             return None
@@ -121,17 +201,14 @@ class SpriteFactory:
         surf_width, surf_height = surface.get_size()
         if surf_width % cell_width != 0 or surf_height % cell_height != 0:
             # Surface doesn't align with cell grid, fall back to Unicode
-            return None
-
-        # Create PixelFrame and PixelSprite
-        frame = pyunicodegame.PixelFrame(surface, cell_width, cell_height)
-        sprite = pyunicodegame.PixelSprite([frame])
-        sprite.x = entity["x"]
-        sprite.y = entity["y"]
-        sprite._teleport_pending = True
-        sprite.lerp_speed = SPRITE_LERP_SPEED
+            frame = None
+        else:
+            frame = pyunicodegame.PixelFrame(surface, cell_width, cell_height)
 
-        return sprite
+        frame_cache[key] = frame
+        if len(frame_cache) > COLORED_CACHE_SIZE:
+            frame_cache.popitem(last=False)
+        return frame
 
     def update_sprite(self, entity: Dict[str, Any]) -> Optional[pyunicodegame.Sprite]:
         """Update a sprite's position and appearance.
@@ -147,16 +224,28 @@ class SpriteFactory:
 
         if sprite is None:
             return None
+        record = self._records[eid]
 
-        # Update position (lerped automatically)
-        if sprite.x != entity["x"] or sprite.y != entity["y"]:
-            sprite.move_to(entity["x"], entity["y"])
+        # Update position (lerped automatically); compare against the last
+        # target rather than reading sprite attributes
+        pos = (entity["x"], entity["y"])
+        if record.pos != pos:
+            sprite.move_to(*pos)
+            record.pos = pos
 
         # Check if appearance needs updating
-        old_cache = self._entity_cache.get(eid)
         new_cache = self._cache_key(entity)
 
-        if old_cache != new_cache:
+        if record.cache_key != new_cache:
+            # Keep the existing Unicode sprite if the change doesn't alter
+            # what it draws (e.g. owner or crafting state on a plain entity)
+            if (
+                (entity.get("metadata") or _EMPTY_META).get("kind") != "item"
+                and record.sprite_def == get_sprite_def(entity, self.player_id)
+            ):
+                record.cache_key = new_cache
+                return sprite
+
             # Recreate sprite with new appearance
             self.remove_sprite(eid)
             return self.create_sprite(entity)
@@ -172,7 +261,7 @@ class SpriteFactory:
         sprite = self.sprites.pop(entity_id, None)
         if sprite:
             self.game_window.remove_sprite(sprite)
-        self._entity_cache.pop(entity_id, None)
+        self._records.pop(entity_id, None)
 
     def get_sprite(self, entity_id: str) -> Optional[pyunicodegame.Sprite]:
         """Get a sprite by entity ID."""
@@ -180,15 +269,19 @@ class SpriteFactory:
 
     def clear_all(self):
         """Remove all sprites."""
-        for eid in list(self.sprites.keys()):
-            self.remove_sprite(eid)
+        remove = self.game_window.remove_sprite
+        for sprite in self.sprites.values():
+            remove(sprite)
+        self.sprites.clear()
+        self._records.clear()
+        self._frame_cache.clear()
 
     def _is_phased_out(self, entity: Dict) -> bool:
         """Check if entity is a phased-out monster (uncontrolled and not autorepeating).
 
         Phased-out monsters owned by the player should not be rendered.
         """
-        metadata = entity.get("metadata", {})
+        metadata = entity.get("metadata") or _EMPTY_META
         if metadata.get("kind") != "monster":
             return False
         # Only check for our own monsters
@@ -196,7 +289,7 @@ class SpriteFactory:
             return False
         if metadata.get("controlled", True):
             return False
-        current_task = metadata.get("current_task", {})
+        current_task = metadata.get("current_task") or _EMPTY_META
         return not current_task.get("is_playing", False)
 
     def sync_entities(
@@ -205,6 +298,7 @@ class SpriteFactory:
         updated_ids: set,
         removed_ids: set,
         entities: Dict[str, Dict],
+        hidden_ids: Optional[set] = None,
     ):
         """Sync sprites with entity changes.
 
@@ -213,50 +307,59 @@ class SpriteFactory:
             updated_ids: Set of updated entity IDs
             removed_ids: Set of removed entity IDs
             entities: Current entity data dict (id -> entity)
+            hidden_ids: Added/updated IDs of phased-out monsters, if the
+                caller has already worked them out
         """
+        # Nothing changed this tick
+        if not (added_ids or updated_ids or removed_ids):
+            return
+
+        remove_sprite = self.remove_sprite
+        get_entity = entities.get
+
+        if hidden_ids is None:
+            is_phased_out = self._is_phased_out
+            hidden_ids = {
+                eid
+                for ids in (added_ids, updated_ids)
+                for eid in ids
+                if eid in entities and is_phased_out(entities[eid])
+            }
+
         # Remove old sprites
         for eid in removed_ids:
-            self.remove_sprite(eid)
+            remove_sprite(eid)
 
         # Update existing sprites (or remove if now phased out)
+        update_sprite = self.update_sprite
         for eid in updated_ids:
-            if eid in entities:
-                entity = entities[eid]
-                if self._is_phased_out(entity):
-                    self.remove_sprite(eid)
+            entity = get_entity(eid)
+            if entity is not None:
+                if eid in hidden_ids:
+                    remove_sprite(eid)
                 else:
-                    self.update_sprite(entity)
+                    update_sprite(entity)
 
         # Create new sprites (skip phased-out monsters)
+        create_sprite = self.create_sprite
         for eid in added_ids:
-            if eid in entities:
-                entity = entities[eid]
-                if not self._is_phased_out(entity):
-                    self.create_sprite(entity)
+            entity = get_entity(eid)
+            if entity is not None and eid not in hidden_ids:
+                create_sprite(entity)
 
-    def _cache_key(self, entity: Dict) -> Dict:
+    def _cache_key(self, entity: Dict) -> Tuple:
         """Create a cache key for entity appearance.
 
-        Used to detect when a sprite needs to be recreated.
+        Used to detect when a sprite needs to be recreated. The key is a flat
+        tuple of only the fields the entity's kind is drawn from, so the
+        per-update comparison is a single tuple compare.
         """
-        metadata = entity.get("metadata", {})
-
-        # Extract effective_color as tuple for hashability
-        effective_color = metadata.get("effective_color")
-        if effective_color is not None and isinstance(effective_color, (list, tuple)):
-            effective_color = tuple(effective_color[:3])
-        else:
-            effective_color = None
-
-        return {
-            "owner_id": entity.get("owner_id"),
-            "kind": metadata.get("kind"),
-            "monster_type": metadata.get("monster_type"),
-            "good_type": metadata.get("good_type"),
-            "is_crafting": metadata.get("is_crafting"),
-            "loaded_item_ids": len(metadata.get("loaded_item_ids", [])) > 0,
-            "effective_color": effective_color,
-        }
+        metadata = entity.get("metadata") or _EMPTY_META
+        kind = metadata.get("kind")
+        builder = _CACHE_KEY_BUILDERS.get(kind)
+        if builder is None:
+            return (kind,)
+        return builder(entity, metadata)
 
 
 class LightManager:
@@ -267,7 +370,8 @@ class LightManager:
 
         Args:
             game_window: The pyunicodegame window
-            enabled: Whether lighting system is enabled
+            enabled: Whether lighting system is enabled; fixed for the
+                manager's lifetime, so a disabled manager never holds lights
         """
         self.game_window = game_window
         self.enabled = enabled
@@ -288,8 +392,6 @@ class LightManager:
         if not self.enabled:
             return None
 
-        from config import LIGHT_CONFIGS
-
         config = LIGHT_CONFIGS["player_torch"]
 
         self.player_light = pyunicodegame.create_light(
@@ -320,28 +422,14 @@ class LightManager:
         if not self.enabled:
             return None
 
-        from config import LIGHT_CONFIGS
-
-        metadata = entity.get("metadata", {})
-        kind = metadata.get("kind")
-
-        # Determine light type
-        config_key = None
-
-        if kind == "workshop" and metadata.get("is_crafting"):
-            config_key = "workshop_active"
-        elif kind == "gathering_spot":
-            config_key = "gathering_spot"
-        elif kind == "signpost":
-            config_key = "signpost"
-        elif kind == "commune":
-            config_key = "commune"
-
-        if config_key is None:
+        config = _light_config(entity)
+        if config is None:
             return None
 
-        config = LIGHT_CONFIGS[config_key]
+        return self._add_entity_light(entity_id, entity, config)
 
+    def _add_entity_light(self, entity_id: str, entity: Dict, config: LightConfig) -> Any:
+        """Create and register a light for an entity with a known config."""
         # Calculate center position for multi-cell entities
         width = entity.get("width", 1)
         height = entity.get("height", 1)
@@ -370,28 +458,39 @@ class LightManager:
 
     def update_entity_light(self, entity_id: str, entity: Dict):
         """Update light for an entity (e.g., workshop started/stopped crafting)."""
-        metadata = entity.get("metadata", {})
-        kind = metadata.get("kind")
-
+        should_have_light = _light_config(entity) is not None
         has_light = entity_id in self.lights
 
-        # Check if entity should have a light
-        should_have_light = False
-        if kind == "workshop" and metadata.get("is_crafting"):
-            should_have_light = True
-        elif kind in ("gathering_spot", "signpost", "commune"):
-            should_have_light = True
-
         # Add or remove light as needed
         if should_have_light and not has_light:
             self.create_entity_light(entity_id, entity)
         elif not should_have_light and has_light:
             self.remove_entity_light(entity_id)
 
+    def update_entity_lights(self, entities: Dict[str, Dict]):
+        """Update lights for a batch of changed entities in one pass.
+
+        Only call this when the manager is enabled; it adds lights directly.
+
+        Args:
+            entities: Changed entities (id -> entity); entities not in the
+                batch keep their current light
+        """
+        lights = self.lights
+        for eid, entity in entities.items():
+            config = _light_config(entity)
+            if config is None:
+                if eid in lights:
+                    self.remove_entity_light(eid)
+            elif eid not in lights:
+                self._add_entity_light(eid, entity, config)
+
     def clear_all(self):
         """Remove all lights."""
-        for eid in list(self.lights.keys()):
-            self.remove_entity_light(eid)
+        remove = self.game_window.remove_light
+        for light in self.lights.values():
+            remove(light)
+        self.lights.clear()
 
         if self.player_light:
             self.game_window.remove_light(self.player_light)
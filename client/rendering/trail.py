@@ -1,6 +1,6 @@
 """Movement trail rendering using Unicode box-drawing characters."""
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from config import (
     TRAIL_COLOR,
@@ -10,6 +10,44 @@ from config import (
     TRAIL_ARROWS,
 )
 
+_TRAIL_DIRECTIONS = ("up", "down", "left", "right")
+
+
+def _trail_char(incoming_dir: str, outgoing_dir: Optional[str], is_last: bool) -> str:
+    """Determine which box-drawing character to use.
+
+    Args:
+        incoming_dir: Direction we moved to reach this cell
+        outgoing_dir: Direction of next move (None if last)
+        is_last: Whether this is the last step in the queue
+
+    Returns:
+        The appropriate Unicode character for this trail segment.
+    """
+    if is_last:
+        # End of trail - use dot
+        return "·"
+
+    if outgoing_dir is None or incoming_dir == outgoing_dir:
+        # Continuing straight
+        if incoming_dir in ("left", "right"):
+            return TRAIL_HORIZONTAL
+        else:
+            return TRAIL_VERTICAL
+
+    # Corner - direction changes
+    return TRAIL_CORNERS.get((incoming_dir, outgoing_dir), "·")
+
+
+# (incoming_dir, outgoing_dir, is_last) -> char, for every combination
+# GameState.get_trail_positions() can produce
+_TRAIL_TABLE: Dict[Tuple[str, Optional[str], bool], str] = {
+    (incoming, outgoing, is_last): _trail_char(incoming, outgoing, is_last)
+    for incoming in _TRAIL_DIRECTIONS
+    for outgoing in _TRAIL_DIRECTIONS + (None,)
+    for is_last in (False, True)
+}
+
 
 class TrailRenderer:
     """Renders the movement prediction trail using box-drawing characters."""
@@ -29,34 +67,12 @@ class TrailRenderer:
             trail_positions: List of (x, y, incoming_dir, outgoing_dir, is_second_to_last, is_last)
                 tuples from GameState.get_trail_positions()
         """
-        for x, y, incoming_dir, outgoing_dir, is_second_to_last, is_last in trail_positions:
-            char = self._get_trail_char(incoming_dir, outgoing_dir, is_second_to_last, is_last)
-            self.overlay_window.put(x, y, char, TRAIL_COLOR)
+        if not trail_positions:
+            return
 
-    def _get_trail_char(
-        self, incoming_dir: str, outgoing_dir: Optional[str], is_second_to_last: bool, is_last: bool
-    ) -> str:
-        """Determine which box-drawing character to use.
+        trail_table = _TRAIL_TABLE
+        put = self.overlay_window.put
+        color = TRAIL_COLOR
+        for x, y, incoming_dir, outgoing_dir, _, is_last in trail_positions:
+            put(x, y, trail_table[(incoming_dir, outgoing_dir, is_last)], color)
 
-        Args:
-            incoming_dir: Direction we moved to reach this cell
-            outgoing_dir: Direction of next move (None if last)
-            is_second_to_last: Whether this is the second-to-last step
-            is_last: Whether this is the last step in the queue
-
-        Returns:
-            The appropriate Unicode character for this trail segment.
-        """
-        if is_last:
-            # End of trail - use dot
-            return "·"
-
-        if outgoing_dir is None or incoming_dir == outgoing_dir:
-            # Continuing straight
-            if incoming_dir in ("left", "right"):
-                return TRAIL_HORIZONTAL
-            else:
-                return TRAIL_VERTICAL
-
-        # Corner - direction changes
-        return TRAIL_CORNERS.get((incoming_dir, outgoing_dir), "·")
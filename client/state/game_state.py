@@ -1,9 +1,47 @@
 """Game state management and entity tracking."""
 
-from typing import Any, Dict, List, Optional, Set, Tuple
+import sys
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from config import DIRECTION_DELTAS
 
+# Neighbor cell offsets, in the order adjacent entities are reported
+_NEIGHBOR_OFFSETS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_NEIGHBOR_OFFSETS_8 = _NEIGHBOR_OFFSETS_4 + ((-1, -1), (1, -1), (-1, 1), (1, 1))
+
+# Unit move -> direction name
+_DELTA_TO_DIRECTION = {delta: direction for direction, delta in DIRECTION_DELTAS.items()}
+
+# Single-byte code per unit move, so movement queues can be compared as bytes
+_STEP_CODES = {delta: code for code, delta in enumerate(DIRECTION_DELTAS.values())}
+
+
+def _encode_steps(steps: List[Dict[str, int]]) -> Optional[bytearray]:
+    """Encode movement steps as step codes, or None if any isn't a unit move."""
+    codes = bytearray()
+    for step in steps:
+        code = _STEP_CODES.get((step.get("dx"), step.get("dy")))
+        if code is None:
+            return None
+        codes.append(code)
+    return codes
+
+
+# Priority order for entity kinds in the context panel (lower is preferred)
+_NEARBY_PRIORITY = {
+    kind: rank
+    for rank, kind in enumerate(
+        ["workshop", "gathering_spot", "wagon", "item", "dispenser", "delivery", "signpost", "monster"]
+    )
+}
+_NEARBY_UNRANKED = len(_NEARBY_PRIORITY)
+
+
+def _nearby_rank(entity: Dict[str, Any]) -> int:
+    """Get an entity's context-panel priority rank."""
+    return _NEARBY_PRIORITY.get(entity.get("metadata", {}).get("kind"), _NEARBY_UNRANKED)
+
 
 class GameState:
     """Manages the local game state synchronized from the server."""
@@ -15,12 +53,26 @@ class GameState:
         # Player info
         self.player_id: Optional[str] = None
         self.local_monster_id: Optional[str] = None
+        # Entity dict of the local monster, refreshed on every sync
+        self._monster_ref: Optional[Dict[str, Any]] = None
+        # Local monster's current_task flags, read once per sync
+        self._hitched_wagon_id: Optional[str] = None
+        self._is_recording: bool = False
+        self._is_playing: bool = False
 
         # Player monster facing direction (for context panel)
         self.facing_direction: str = "down"
 
         # Spatial index for quick lookups
         self._position_index: Dict[Tuple[int, int], Set[str]] = {}
+        # Cells each entity was indexed at, as (x, y, width, height), so
+        # removal clears exactly what was added
+        self._indexed_footprints: Dict[str, Tuple[int, int, int, int]] = {}
+
+        # Terrain occupancy: cell -> number of terrain blocks covering it,
+        # plus each terrain block's (x, y, width, height) footprint
+        self._terrain_cells: Dict[Tuple[int, int], int] = {}
+        self._terrain_footprints: Dict[str, Tuple[int, int, int, int]] = {}
 
         # Tutorial tracking
         self.shown_hints: Set[str] = set()
@@ -29,6 +81,11 @@ class GameState:
 
         # Movement prediction queue (client-side, for immediate trail feedback)
         self.predicted_queue: List[Dict[str, int]] = []
+        # One byte per queued step (see _STEP_CODES), or None if the queue
+        # holds a step that isn't a unit move
+        self._predicted_codes: Optional[bytearray] = bytearray()
+        # Summed (dx, dy) of the queue, or None until it is next needed
+        self._predicted_offset: Optional[Tuple[int, int]] = (0, 0)
         self.zone_width: int = 60
         self.zone_height: int = 40
 
@@ -53,13 +110,27 @@ class GameState:
         server_ids = set()
         added_ids = set()
         updated_ids = set()
+        player_id = self.player_id
 
         for entity_data in server_entities:
-            eid = entity_data["id"]
+            # Intern ids so the sprite/light/effect dicts downstream all see
+            # the same string object and compare by identity
+            eid = entity_data["id"] = sys.intern(entity_data["id"])
             server_ids.add(eid)
 
-            # Check if this is our monster
-            if self._is_player_monster(entity_data):
+            # Store item colors as RGB tuples once, so renderers can use them
+            # as cache keys directly (None if malformed)
+            metadata = entity_data.get("metadata")
+            if metadata and "effective_color" in metadata:
+                color = metadata["effective_color"]
+                if isinstance(color, (list, tuple)):
+                    metadata["effective_color"] = tuple(color[:3])
+                elif color is not None:
+                    metadata["effective_color"] = None
+
+            # Check if this is our monster (cheap owner test first - most
+            # entities belong to someone else or to nobody)
+            if entity_data.get("owner_id") == player_id and self._is_player_monster(entity_data):
                 self.local_monster_id = eid
 
             if eid in self.entities:
@@ -67,30 +138,38 @@ class GameState:
                 old_data = self.entities[eid]
                 if self._entity_changed(old_data, entity_data):
                     updated_ids.add(eid)
+                    self._update_terrain(eid, entity_data)
                     # Update spatial index if position changed
                     if old_data["x"] != entity_data["x"] or old_data["y"] != entity_data["y"]:
-                        self._remove_from_position_index(eid, old_data["x"], old_data["y"])
+                        self._remove_from_position_index(eid)
                         self._add_to_position_index(eid, entity_data["x"], entity_data["y"])
             else:
                 # New entity
                 added_ids.add(eid)
                 self._add_to_position_index(eid, entity_data["x"], entity_data["y"])
+                self._update_terrain(eid, entity_data)
 
             self.entities[eid] = entity_data
 
-        # Find removed entities
-        current_ids = set(self.entities.keys())
-        removed_ids = current_ids - server_ids
+        # Find removed entities. Every server entity is stored by now, so
+        # matching counts mean nothing was removed
+        if len(self.entities) == len(server_ids):
+            removed_ids = set()
+        else:
+            removed_ids = {eid for eid in self.entities if eid not in server_ids}
 
         for eid in removed_ids:
-            old_data = self.entities[eid]
-            self._remove_from_position_index(eid, old_data["x"], old_data["y"])
+            self._remove_from_position_index(eid)
+            self._update_terrain(eid, None)
             del self.entities[eid]
 
         # Clear local monster if it was removed
         if self.local_monster_id in removed_ids:
             self.local_monster_id = None
 
+        self._monster_ref = self.entities.get(self.local_monster_id) if self.local_monster_id else None
+        self._refresh_monster_flags()
+
         return added_ids, updated_ids, removed_ids
 
     def _is_player_monster(self, entity_data: Dict) -> bool:
@@ -134,6 +213,7 @@ class GameState:
         entity = self.entities.get(eid) or {"width": 1, "height": 1}
         width = entity.get("width", 1)
         height = entity.get("height", 1)
+        self._indexed_footprints[eid] = (x, y, width, height)
 
         for dx in range(width):
             for dy in range(height):
@@ -142,11 +222,12 @@ class GameState:
                     self._position_index[pos] = set()
                 self._position_index[pos].add(eid)
 
-    def _remove_from_position_index(self, eid: str, x: int, y: int):
+    def _remove_from_position_index(self, eid: str):
         """Remove entity from spatial index."""
-        entity = self.entities.get(eid) or {"width": 1, "height": 1}
-        width = entity.get("width", 1)
-        height = entity.get("height", 1)
+        footprint = self._indexed_footprints.pop(eid, None)
+        if footprint is None:
+            return
+        x, y, width, height = footprint
 
         for dx in range(width):
             for dy in range(height):
@@ -162,16 +243,19 @@ class GameState:
 
     def get_player_monster(self) -> Optional[Dict]:
         """Get the player's monster entity."""
-        if self.local_monster_id:
-            return self.entities.get(self.local_monster_id)
-        return None
+        return self._monster_ref
 
     def get_entities_at(self, x: int, y: int) -> List[Dict]:
         """Get all entities occupying a position."""
-        pos = (x, y)
-        if pos not in self._position_index:
-            return []
-        return [self.entities[eid] for eid in self._position_index[pos] if eid in self.entities]
+        return list(self.iter_entities_at(x, y))
+
+    def iter_entities_at(self, x: int, y: int) -> Iterable[Dict]:
+        """Iterate over the entities occupying a position without building a list."""
+        ids = self._position_index.get((x, y))
+        if not ids:
+            return ()
+        entities = self.entities
+        return (entities[eid] for eid in ids)
 
     def get_adjacent_entities(self, x: int, y: int, include_diagonals: bool = False) -> List[Dict]:
         """Get all entities adjacent to a position.
@@ -183,19 +267,14 @@ class GameState:
         Returns:
             List of adjacent entity data dicts
         """
-        adjacent = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        if include_diagonals:
-            directions.extend([(-1, -1), (1, -1), (-1, 1), (1, 1)])
-
-        seen_ids = set()
-        for dx, dy in directions:
-            for entity in self.get_entities_at(x + dx, y + dy):
-                if entity["id"] not in seen_ids:
-                    adjacent.append(entity)
-                    seen_ids.add(entity["id"])
-
-        return adjacent
+        offsets = _NEIGHBOR_OFFSETS_8 if include_diagonals else _NEIGHBOR_OFFSETS_4
+        index = self._position_index
+        # dict.fromkeys dedupes ids across cells while keeping first-seen order
+        ids = dict.fromkeys(
+            chain.from_iterable(index.get((x + dx, y + dy), ()) for dx, dy in offsets)
+        )
+        entities = self.entities
+        return [entities[eid] for eid in ids]
 
     def get_nearby_entity(self) -> Optional[Dict]:
         """Get a nearby entity for the context panel.
@@ -210,26 +289,20 @@ class GameState:
         if not monster:
             return None
 
-        # Priority order for entity kinds
-        priority = ["workshop", "gathering_spot", "wagon", "item", "dispenser", "delivery", "signpost", "monster"]
-
-        def pick_best(entities: list) -> Optional[Dict]:
-            """Pick the highest priority entity from a list."""
+        def pick_best(entities: Iterable[Dict]) -> Optional[Dict]:
+            """Pick the highest priority entity from an iterable."""
             # Filter out the player's own monster
             entities = [e for e in entities if e["id"] != self.local_monster_id]
             if not entities:
                 return None
-            for kind in priority:
-                for entity in entities:
-                    if entity.get("metadata", {}).get("kind") == kind:
-                        return entity
-            return entities[0]
+            # First entity of the best-ranked kind; unranked kinds tie last
+            return min(entities, key=_nearby_rank)
 
         # First, check the facing direction
         dx, dy = DIRECTION_DELTAS.get(self.facing_direction, (0, 0))
         target_x = monster["x"] + dx
         target_y = monster["y"] + dy
-        facing_entities = self.get_entities_at(target_x, target_y)
+        facing_entities = self.iter_entities_at(target_x, target_y)
         result = pick_best(facing_entities)
         if result:
             return result
@@ -283,30 +356,29 @@ class GameState:
 
     def is_monster_hitched(self) -> bool:
         """Check if the player's monster is hitched to a wagon."""
-        monster = self.get_player_monster()
-        if not monster:
-            return False
-
-        current_task = monster.get("metadata", {}).get("current_task", {})
-        return current_task.get("hitched_wagon_id") is not None
+        return self._hitched_wagon_id is not None
 
     def is_monster_recording(self) -> bool:
         """Check if the player's monster is recording."""
-        monster = self.get_player_monster()
-        if not monster:
-            return False
-
-        current_task = monster.get("metadata", {}).get("current_task", {})
-        return current_task.get("is_recording", False)
+        return self._is_recording
 
     def is_monster_playing(self) -> bool:
         """Check if the player's monster is playing back a recording."""
-        monster = self.get_player_monster()
+        return self._is_playing
+
+    def _refresh_monster_flags(self):
+        """Read the local monster's current_task flags (defaults if no monster)."""
+        monster = self._monster_ref
         if not monster:
-            return False
+            self._hitched_wagon_id = None
+            self._is_recording = False
+            self._is_playing = False
+            return
 
         current_task = monster.get("metadata", {}).get("current_task", {})
-        return current_task.get("is_playing", False)
+        self._hitched_wagon_id = current_task.get("hitched_wagon_id")
+        self._is_recording = current_task.get("is_recording", False)
+        self._is_playing = current_task.get("is_playing", False)
 
     # --- Movement Prediction Queue Methods ---
 
@@ -327,14 +399,22 @@ class GameState:
         if dx == 0 and dy == 0:
             return False
 
-        # Calculate future position after completing current queue
-        future_x, future_y = monster["x"], monster["y"]
-        for step in self.predicted_queue:
-            future_x += step.get("dx", 0)
-            future_y += step.get("dy", 0)
-
-        next_x = future_x + dx
-        next_y = future_y + dy
+        # Calculate future position after completing current queue. The
+        # queue's offset is kept relative to the monster, so it stays valid
+        # when the monster moves
+        offset = self._predicted_offset
+        if offset is None:
+            offset_x = offset_y = 0
+            for step in self.predicted_queue:
+                offset_x += step.get("dx", 0)
+                offset_y += step.get("dy", 0)
+        else:
+            offset_x, offset_y = offset
+        offset_x += dx
+        offset_y += dy
+
+        next_x = monster["x"] + offset_x
+        next_y = monster["y"] + offset_y
 
         # Validate bounds
         if not self._is_in_bounds(next_x, next_y):
@@ -346,6 +426,9 @@ class GameState:
 
         # Add to queue
         self.predicted_queue.append({"dx": dx, "dy": dy})
+        self._predicted_offset = (offset_x, offset_y)
+        if self._predicted_codes is not None:
+            self._predicted_codes.append(_STEP_CODES[(dx, dy)])
         return True
 
     def get_trail_positions(self) -> List[Tuple[int, int, str, Optional[str], bool, bool]]:
@@ -362,28 +445,21 @@ class GameState:
 
         positions = []
         x, y = monster["x"], monster["y"]
-        queue_len = len(self.predicted_queue)
-
-        for i, step in enumerate(self.predicted_queue):
-            dx = step.get("dx", 0)
-            dy = step.get("dy", 0)
-            incoming_dir = self._delta_to_direction(dx, dy)
-
+        steps = [(step.get("dx", 0), step.get("dy", 0)) for step in self.predicted_queue]
+        # Each step's direction is both its incoming and the previous
+        # step's outgoing direction, so resolve it once
+        to_direction = self._delta_to_direction
+        directions = [to_direction(dx, dy) for dx, dy in steps]
+        last = len(steps) - 1
+
+        for i, (dx, dy) in enumerate(steps):
             x += dx
             y += dy
 
             # Look ahead to get outgoing direction
-            if i + 1 < queue_len:
-                next_step = self.predicted_queue[i + 1]
-                outgoing_dir = self._delta_to_direction(
-                    next_step.get("dx", 0), next_step.get("dy", 0)
-                )
-            else:
-                outgoing_dir = None
+            outgoing_dir = directions[i + 1] if i < last else None
 
-            is_second_to_last = (i == queue_len - 2)
-            is_last = (i == queue_len - 1)
-            positions.append((x, y, incoming_dir, outgoing_dir, is_second_to_last, is_last))
+            positions.append((x, y, directions[i], outgoing_dir, i == last - 1, i == last))
 
         return positions
 
@@ -403,17 +479,35 @@ class GameState:
 
         # If server queue is empty, clear our predictions
         if server_len == 0:
-            self.predicted_queue = []
+            self.clear_predicted_queue()
             return
 
         # If client queue is empty, accept server state
         if client_len == 0:
-            self.predicted_queue = list(server_queue)
+            self._set_predicted_queue(list(server_queue))
             return
 
         # Try to find where server queue aligns with client queue
         # Server executes from front, so server queue should match a suffix of client queue
         # But client may also have added predictions beyond what server knows
+        client_codes = self._predicted_codes
+        server_codes = _encode_steps(server_queue)
+
+        if client_codes is not None and server_codes is not None:
+            # Both queues are plain unit steps: match them as byte strings.
+            # The expected offset (server executed some moves) is a suffix
+            # match; otherwise take the earliest alignment
+            if client_codes.endswith(server_codes):
+                offset = client_len - server_len
+            else:
+                offset = client_codes.find(server_codes)
+            if offset >= 0:
+                self._drop_predicted_steps(offset)
+            else:
+                self.predicted_queue = list(server_queue)
+                self._predicted_codes = server_codes
+                self._predicted_offset = None
+            return
 
         def check_alignment(offset: int) -> bool:
             """Check if server queue matches client queue starting at offset."""
@@ -429,22 +523,58 @@ class GameState:
         if client_len >= server_len:
             expected_offset = client_len - server_len
             if check_alignment(expected_offset):
-                self.predicted_queue = self.predicted_queue[expected_offset:]
+                self._drop_predicted_steps(expected_offset)
                 return
 
         # Fall back: check other alignments (client may have added predictions)
         for offset in range(client_len):
             remaining_client = client_len - offset
             if remaining_client >= server_len and check_alignment(offset):
-                self.predicted_queue = self.predicted_queue[offset:]
+                self._drop_predicted_steps(offset)
                 return
 
         # No alignment found - accept server's authoritative state
-        self.predicted_queue = list(server_queue)
+        self._set_predicted_queue(list(server_queue))
 
     def clear_predicted_queue(self):
         """Clear the prediction queue."""
         self.predicted_queue = []
+        self._predicted_codes = bytearray()
+        self._predicted_offset = (0, 0)
+
+    def _drop_predicted_steps(self, count: int):
+        """Drop steps the server has executed from the front of the queue.
+
+        The cached queue offset is kept up to date rather than reset, so
+        syncing an unchanged queue leaves add_predicted_step O(1).
+
+        Args:
+            count: Number of leading steps to drop
+        """
+        if count == 0:
+            return
+
+        dropped = self.predicted_queue[:count]
+        self.predicted_queue = self.predicted_queue[count:]
+        if self._predicted_codes is not None:
+            self._predicted_codes = self._predicted_codes[count:]
+        else:
+            # The remaining steps may all be unit moves again
+            self._predicted_codes = _encode_steps(self.predicted_queue)
+
+        offset = self._predicted_offset
+        if offset is not None:
+            offset_x, offset_y = offset
+            for step in dropped:
+                offset_x -= step.get("dx", 0)
+                offset_y -= step.get("dy", 0)
+            self._predicted_offset = (offset_x, offset_y)
+
+    def _set_predicted_queue(self, queue: List[Dict[str, int]]):
+        """Replace the prediction queue and re-encode its step codes."""
+        self.predicted_queue = queue
+        self._predicted_codes = _encode_steps(queue)
+        self._predicted_offset = None
 
     def _is_in_bounds(self, x: int, y: int) -> bool:
         """Check if position is within zone bounds."""
@@ -452,18 +582,53 @@ class GameState:
 
     def _is_terrain_at(self, x: int, y: int) -> bool:
         """Check if there's a terrain block at position."""
-        for entity in self.entities.values():
-            metadata = entity.get("metadata", {})
-            if metadata.get("kind") == "terrain_block":
-                ex, ey = entity["x"], entity["y"]
-                ew = entity.get("width", 1)
-                eh = entity.get("height", 1)
-                if ex <= x < ex + ew and ey <= y < ey + eh:
-                    return True
-        return False
+        return (x, y) in self._terrain_cells
+
+    def _update_terrain(self, eid: str, entity_data: Optional[Dict]):
+        """Refresh the terrain cells covered by an entity.
+
+        Args:
+            eid: Entity ID
+            entity_data: Current entity data, or None if it was removed
+        """
+        footprint = None
+        if entity_data is not None and entity_data.get("metadata", {}).get("kind") == "terrain_block":
+            footprint = (
+                entity_data["x"],
+                entity_data["y"],
+                entity_data.get("width", 1),
+                entity_data.get("height", 1),
+            )
+
+        old_footprint = self._terrain_footprints.get(eid)
+        if old_footprint == footprint:
+            return
+
+        cells = self._terrain_cells
+        if old_footprint is not None:
+            del self._terrain_footprints[eid]
+            ex, ey, ew, eh = old_footprint
+            for cx in range(ex, ex + ew):
+                for cy in range(ey, ey + eh):
+                    pos = (cx, cy)
+                    if cells[pos] == 1:
+                        del cells[pos]
+                    else:
+                        cells[pos] -= 1
+
+        if footprint is not None:
+            self._terrain_footprints[eid] = footprint
+            ex, ey, ew, eh = footprint
+            for cx in range(ex, ex + ew):
+                for cy in range(ey, ey + eh):
+                    pos = (cx, cy)
+                    cells[pos] = cells.get(pos, 0) + 1
 
     def _delta_to_direction(self, dx: int, dy: int) -> str:
         """Convert delta to direction string."""
+        direction = _DELTA_TO_DIRECTION.get((dx, dy))
+        if direction is not None:
+            return direction
         if dx > 0:
             return "right"
         if dx < 0:
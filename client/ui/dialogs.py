@@ -1,11 +1,91 @@
 """Dialog rendering for spawn monster and recipe selection."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from config import Color, MONSTER_TYPES, TRANSFERABLE_SKILLS
 from input.handlers import SpawnDialogState, RecipeDialogState
 
 
+@lru_cache(maxsize=32)
+def _box_commands(width: int, height: int, title: str) -> Tuple[Tuple[int, int, str, tuple], ...]:
+    """Build (and memoize) the draw commands for a dialog box.
+
+    Args:
+        width, height: Box dimensions
+        title: Title text, or "" for none
+
+    Returns:
+        Tuple of (dx, dy, text, color) relative to the box's top-left corner
+    """
+    # Top border
+    if title:
+        padding = (width - len(title) - 2) // 2
+        top = "+" + "-" * padding + " " + title + " " + "-" * (width - padding - len(title) - 3) + "+"
+    else:
+        top = "+" + "-" * (width - 2) + "+"
+    commands = [(0, 0, top, Color.PANEL_BORDER)]
+
+    # Sides, with the interior cleared in the same string
+    side = "|" + " " * (width - 2) + "|"
+    commands.extend((0, row, side, Color.PANEL_BORDER) for row in range(1, height - 1))
+
+    # Bottom border
+    commands.append((0, height - 1, "+" + "-" * (width - 2) + "+", Color.PANEL_BORDER))
+    return tuple(commands)
+
+
+# Help overlay rows as (key, action); an empty action marks a section
+# header and an empty row is a spacer
+_HELP_BINDINGS = (
+    ("Movement", ""),
+    ("  WASD / Arrow Keys", "Move monster"),
+    ("", ""),
+    ("Actions", ""),
+    ("  Space / E", "Interact"),
+    ("  R", "Toggle Recording"),
+    ("  P", "Toggle Playback"),
+    ("  H", "Hitch/Unhitch Wagon"),
+    ("  U", "Unload Wagon"),
+    ("", ""),
+    ("Menus", ""),
+    ("  N", "New Monster"),
+    ("  C", "Craft/Select Recipe"),
+    ("  F1", "This Help"),
+    ("", ""),
+    ("  Q / Esc", "Quit"),
+)
+
+
+def _help_draw_plan() -> Tuple[Tuple[int, int, str, tuple], ...]:
+    """Build the help overlay's draw commands relative to its inner corner."""
+    commands = []
+    for i, (key, action) in enumerate(_HELP_BINDINGS):
+        if action:
+            commands.append((0, i, key, Color.TEXT_HIGHLIGHT))
+            commands.append((22, i, action, Color.TEXT_SECONDARY))
+        elif key:
+            # Section header
+            commands.append((0, i, key, Color.TEXT_PRIMARY))
+    return tuple(commands)
+
+
+_HELP_DRAW_PLAN = _help_draw_plan()
+
+
+# Spawn dialog skill rows, indexed [is_cursor][is_selected] per skill
+_SKILL_ROWS = tuple(
+    tuple(
+        tuple(
+            f"{prefix}{checkbox} {skill.replace('_', ' ').title()}"
+            for checkbox in ("[ ]", "[x]")
+        )
+        for prefix in ("  ", "> ")
+    )
+    for skill in TRANSFERABLE_SKILLS
+)
+
+
 class DialogRenderer:
     """Base class for dialog rendering."""
 
@@ -25,23 +105,9 @@ class DialogRenderer:
             width, height: Box dimensions
             title: Optional title
         """
-        # Top border
-        if title:
-            padding = (width - len(title) - 2) // 2
-            top = "+" + "-" * padding + " " + title + " " + "-" * (width - padding - len(title) - 3) + "+"
-        else:
-            top = "+" + "-" * (width - 2) + "+"
-        self.window.put_string(x, y, top, Color.PANEL_BORDER)
-
-        # Sides
-        for row in range(1, height - 1):
-            self.window.put(x, y + row, "|", Color.PANEL_BORDER)
-            self.window.put(x + width - 1, y + row, "|", Color.PANEL_BORDER)
-            # Clear interior
-            self.window.put_string(x + 1, y + row, " " * (width - 2), Color.TEXT_PRIMARY)
-
-        # Bottom border
-        self.window.put_string(x, y + height - 1, "+" + "-" * (width - 2) + "+", Color.PANEL_BORDER)
+        put_string = self.window.put_string
+        for dx, dy, text, color in _box_commands(width, height, title):
+            put_string(x + dx, y + dy, text, color)
 
 
 class SpawnDialog(DialogRenderer):
@@ -107,19 +173,18 @@ class SpawnDialog(DialogRenderer):
         inner_y += 1
 
         # Skill list
-        for i, skill in enumerate(TRANSFERABLE_SKILLS):
-            checkbox = "[x]" if skill in state.selected_skills else "[ ]"
-            skill_display = skill.replace("_", " ").title()
+        cursor = state.skill_cursor if state.focus == "skills" else None
+        for i, (skill, rows) in enumerate(zip(TRANSFERABLE_SKILLS, _SKILL_ROWS)):
+            is_selected = skill in state.selected_skills
 
             # Highlight current selection
-            if state.focus == "skills" and i == state.skill_cursor:
+            is_cursor = i == cursor
+            if is_cursor:
                 color = Color.TEXT_HIGHLIGHT
-                prefix = "> "
             else:
-                color = Color.TEXT_SECONDARY if skill in state.selected_skills else Color.TEXT_MUTED
-                prefix = "  "
+                color = Color.TEXT_SECONDARY if is_selected else Color.TEXT_MUTED
 
-            self.window.put_string(inner_x, inner_y + i, f"{prefix}{checkbox} {skill_display}", color)
+            self.window.put_string(inner_x, inner_y + i, rows[is_cursor][is_selected], color)
 
         # Controls hint
         hint_y = y + self.HEIGHT - 2
@@ -143,6 +208,20 @@ class RecipeDialog(DialogRenderer):
     WIDTH = 38
     HEIGHT = 18
 
+    # Draw plans kept for recently rendered dialog states
+    RENDER_CACHE_SIZE = 4
+
+    def __init__(self, window):
+        """Initialize the recipe dialog.
+
+        Args:
+            window: pyunicodegame window (usually the UI root)
+        """
+        super().__init__(window)
+        # Cache key -> (recipes, recipe_details, draw commands). The
+        # recipe list and details are kept so their ids can't be reused
+        self._render_cache: Dict[tuple, Tuple[list, Optional[dict], List[tuple]]] = {}
+
     def render(
         self,
         state: RecipeDialogState,
@@ -165,11 +244,44 @@ class RecipeDialog(DialogRenderer):
         title = f"SELECT RECIPE"
         self._draw_box(x, y, self.WIDTH, self.HEIGHT, title)
 
-        inner_x = x + 2
-        inner_y = y + 2
+        # The contents only change with the recipe list, the selection or
+        # the details, so replay the last draw plan built for them
+        recipes = state.available_recipes
+        key = (id(recipes), len(recipes), state.selected_index, state.workshop_name, id(recipe_details))
+        cached = self._render_cache.get(key)
+        if cached is not None and cached[0] is recipes and cached[1] is recipe_details:
+            commands = cached[2]
+        else:
+            commands = self._build_commands(state, recipe_details)
+            if len(self._render_cache) >= self.RENDER_CACHE_SIZE:
+                # Evict the oldest plan
+                del self._render_cache[next(iter(self._render_cache))]
+            self._render_cache[key] = (recipes, recipe_details, commands)
+
+        put_string = self.window.put_string
+        for dx, dy, text, color in commands:
+            put_string(x + dx, y + dy, text, color)
+
+    def _build_commands(self, state: RecipeDialogState, recipe_details: Optional[dict]) -> List[tuple]:
+        """Build the dialog's contents as draw commands.
+
+        Args:
+            state: Current dialog state
+            recipe_details: Optional details about selected recipe
+
+        Returns:
+            List of (dx, dy, text, color) relative to the dialog's top-left corner
+        """
+        commands = []
+
+        def add(dx: int, dy: int, text: str, color: tuple):
+            commands.append((dx, dy, text, color))
+
+        inner_x = 2
+        inner_y = 2
 
         # Workshop name
-        self.window.put_string(inner_x, inner_y, f"Workshop: {state.workshop_name}", Color.TEXT_SECONDARY)
+        add(inner_x, inner_y, f"Workshop: {state.workshop_name}", Color.TEXT_SECONDARY)
         inner_y += 2
 
         # Recipe list
@@ -197,19 +309,19 @@ class RecipeDialog(DialogRenderer):
             if len(display_name) > self.WIDTH - 6:
                 display_name = display_name[: self.WIDTH - 9] + "..."
 
-            self.window.put_string(inner_x, inner_y + i, f"{prefix}{display_name}", color)
+            add(inner_x, inner_y + i, f"{prefix}{display_name}", color)
 
         # Scroll indicators
         if start_idx > 0:
-            self.window.put_string(x + self.WIDTH - 4, inner_y, "^^^", Color.TEXT_MUTED)
+            add(self.WIDTH - 4, inner_y, "^^^", Color.TEXT_MUTED)
         if end_idx < len(state.available_recipes):
-            self.window.put_string(x + self.WIDTH - 4, inner_y + visible_recipes - 1, "vvv", Color.TEXT_MUTED)
+            add(self.WIDTH - 4, inner_y + visible_recipes - 1, "vvv", Color.TEXT_MUTED)
 
         inner_y += visible_recipes + 1
 
         # Recipe details
         if recipe_details and state.selected_recipe:
-            self.window.put_string(inner_x, inner_y, "Requirements:", Color.TEXT_SECONDARY)
+            add(inner_x, inner_y, "Requirements:", Color.TEXT_SECONDARY)
             inner_y += 1
 
             # Inputs
@@ -220,7 +332,7 @@ class RecipeDialog(DialogRenderer):
                     inputs_str += f" (+{len(inputs) - 2})"
                 if len(inputs_str) > self.WIDTH - 4:
                     inputs_str = inputs_str[: self.WIDTH - 7] + "..."
-                self.window.put_string(inner_x, inner_y, f"  In: {inputs_str}", Color.TEXT_MUTED)
+                add(inner_x, inner_y, f"  In: {inputs_str}", Color.TEXT_MUTED)
                 inner_y += 1
 
             # Tools
@@ -231,17 +343,19 @@ class RecipeDialog(DialogRenderer):
                     tools_str += f" (+{len(tools) - 2})"
                 if len(tools_str) > self.WIDTH - 4:
                     tools_str = tools_str[: self.WIDTH - 7] + "..."
-                self.window.put_string(inner_x, inner_y, f"  Tools: {tools_str}", Color.TEXT_MUTED)
+                add(inner_x, inner_y, f"  Tools: {tools_str}", Color.TEXT_MUTED)
                 inner_y += 1
 
             # Time
             time_ticks = recipe_details.get("time", 0)
-            self.window.put_string(inner_x, inner_y, f"  Time: {time_ticks} ticks", Color.TEXT_MUTED)
+            add(inner_x, inner_y, f"  Time: {time_ticks} ticks", Color.TEXT_MUTED)
 
         # Controls hint
-        hint_y = y + self.HEIGHT - 2
-        self.window.put_string(inner_x, hint_y, "[Enter] Select", Color.SUCCESS)
-        self.window.put_string(inner_x + 16, hint_y, "[Esc] Cancel", Color.TEXT_SECONDARY)
+        hint_y = self.HEIGHT - 2
+        add(inner_x, hint_y, "[Enter] Select", Color.SUCCESS)
+        add(inner_x + 16, hint_y, "[Esc] Cancel", Color.TEXT_SECONDARY)
+
+        return commands
 
 
 class HelpOverlay(DialogRenderer):
@@ -265,32 +379,9 @@ class HelpOverlay(DialogRenderer):
         inner_y = y + 2
 
         # Keybindings
-        bindings = [
-            ("Movement", ""),
-            ("  WASD / Arrow Keys", "Move monster"),
-            ("", ""),
-            ("Actions", ""),
-            ("  Space / E", "Interact"),
-            ("  R", "Toggle Recording"),
-            ("  P", "Toggle Playback"),
-            ("  H", "Hitch/Unhitch Wagon"),
-            ("  U", "Unload Wagon"),
-            ("", ""),
-            ("Menus", ""),
-            ("  N", "New Monster"),
-            ("  C", "Craft/Select Recipe"),
-            ("  F1", "This Help"),
-            ("", ""),
-            ("  Q / Esc", "Quit"),
-        ]
-
-        for i, (key, action) in enumerate(bindings):
-            if action:
-                self.window.put_string(inner_x, inner_y + i, key, Color.TEXT_HIGHLIGHT)
-                self.window.put_string(inner_x + 22, inner_y + i, action, Color.TEXT_SECONDARY)
-            elif key:
-                # Section header
-                self.window.put_string(inner_x, inner_y + i, key, Color.TEXT_PRIMARY)
+        put_string = self.window.put_string
+        for dx, dy, text, color in _HELP_DRAW_PLAN:
+            put_string(inner_x + dx, inner_y + dy, text, color)
 
         # Dismiss hint
         hint_y = y + self.HEIGHT - 2
@@ -1,10 +1,57 @@
 """Notification system for displaying event messages."""
 
 import time
-from typing import List, Optional, Tuple
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Deque, List, Optional, Tuple
 
 from config import Color, NOTIFICATION_DURATION, NOTIFICATION_HEIGHT
 
+# Wedge characters for speech bubble corners
+_TL = chr(0x1FB3C + 5)   # 🭁
+_TR = chr(0x1FB3C + 16)  # 🭌
+_BL = chr(0x1FB3C + 22)  # 🭒
+_BR = chr(0x1FB3C + 33)  # 🭝
+_BLOCK = chr(0x2588)     # █
+_TAIL = chr(0x1FB3C + 29)  # 🭙
+
+# Clears one notification row
+_BLANK_ROW = " " * 100
+
+# Number of fade steps between full color and black
+_FADE_LEVELS = 15
+
+
+@lru_cache(maxsize=256)
+def _faded_color(color: Tuple[int, int, int], level: int) -> Tuple[int, int, int]:
+    """Build (and memoize) a color scaled to a fade level."""
+    return tuple(c * level // _FADE_LEVELS for c in color)
+
+
+@lru_cache(maxsize=64)
+def _wrap_lines(text: str, max_width: int) -> Tuple[str, ...]:
+    """Wrap (and memoize) text into lines that fit a width."""
+    words = text.split()
+    lines = []
+    current_line = []
+    current_length = 0
+
+    for word in words:
+        if current_length + len(word) + 1 <= max_width:
+            current_line.append(word)
+            current_length += len(word) + 1
+        else:
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [word]
+            current_length = len(word)
+
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    return tuple(lines)
+
 
 class Notification:
     """A single notification message."""
@@ -23,20 +70,37 @@ class Notification:
     @property
     def is_expired(self) -> bool:
         """Check if notification should be removed."""
-        return self.age >= self.duration
+        return self.is_expired_at(time.time())
+
+    def is_expired_at(self, now: float) -> bool:
+        """Check if notification should be removed at the given time."""
+        return now - self.created >= self.duration
 
     @property
     def alpha_factor(self) -> float:
         """Get alpha factor for fading (0.0 to 1.0)."""
-        remaining = self.duration - self.age
+        return self.alpha_at(time.time())
+
+    def alpha_at(self, now: float) -> float:
+        """Get alpha factor for fading (0.0 to 1.0) at the given time."""
+        remaining = self.duration - (now - self.created)
         if remaining <= 1.0:
             return max(0.0, remaining)
         return 1.0
 
-    def get_faded_color(self) -> Tuple[int, int, int]:
-        """Get color with fade applied."""
-        factor = self.alpha_factor
-        return tuple(int(c * factor) for c in self.color)
+    def get_faded_color(self, now: Optional[float] = None) -> Tuple[int, int, int]:
+        """Get color with fade applied.
+
+        The fade is quantized to _FADE_LEVELS steps, so the same tuple is
+        returned for every frame within a step.
+
+        Args:
+            now: Current time, or None to read the clock
+        """
+        if now is None:
+            now = time.time()
+        level = int(self.alpha_at(now) * _FADE_LEVELS)
+        return _faded_color(self.color, level)
 
 
 class NotificationManager:
@@ -51,7 +115,12 @@ class NotificationManager:
         """
         self.window = window
         self.max_messages = max_messages
-        self.notifications: List[Notification] = []
+        # Appending past max_messages drops the oldest notification
+        self.notifications: Deque[Notification] = deque(maxlen=max_messages)
+        # Earliest time any notification can expire (inf when there are none)
+        self._next_expiry: float = float("inf")
+        # (text, color) per row as last drawn, or None before the first render
+        self._last_signature: Optional[Tuple[Tuple[str, Tuple[int, int, int]], ...]] = None
 
     def add(self, text: str, color: Tuple[int, int, int] = Color.TEXT_PRIMARY):
         """Add a notification message.
@@ -62,10 +131,7 @@ class NotificationManager:
         """
         notification = Notification(text, color)
         self.notifications.append(notification)
-
-        # Remove oldest if over limit
-        while len(self.notifications) > self.max_messages:
-            self.notifications.pop(0)
+        self._next_expiry = min(self._next_expiry, notification.created + notification.duration)
 
     def add_success(self, text: str):
         """Add a success notification."""
@@ -83,25 +149,55 @@ class NotificationManager:
         """Add an info notification."""
         self.add(text, Color.INFO)
 
-    def update(self):
-        """Remove expired notifications."""
-        self.notifications = [n for n in self.notifications if not n.is_expired]
+    def update(self, now: Optional[float] = None):
+        """Remove expired notifications.
+
+        Args:
+            now: Current time, or None to read the clock
+        """
+        if now is None:
+            now = time.time()
+        if now < self._next_expiry:
+            return
+
+        self.notifications = deque(
+            (n for n in self.notifications if not n.is_expired_at(now)),
+            maxlen=self.max_messages,
+        )
+        self._next_expiry = min(
+            (n.created + n.duration for n in self.notifications), default=float("inf")
+        )
 
     def render(self):
-        """Render all active notifications."""
-        self.update()
+        """Render all active notifications.
+
+        Rows are only redrawn when their text or color changed; the
+        notification window keeps its cells between frames.
+        """
+        # Read the clock once for the whole frame
+        now = time.time()
+        self.update(now)
+
+        signature = tuple(
+            (notification.text, notification.get_faded_color(now))
+            for notification in islice(self.notifications, NOTIFICATION_HEIGHT)
+        )
+        last = self._last_signature
+        if signature == last:
+            return
 
-        # Clear the notification area
+        # Only clear and redraw the rows whose text or color changed
         for y in range(NOTIFICATION_HEIGHT):
-            self.window.put_string(0, y, " " * 100, Color.TEXT_PRIMARY)
+            row = signature[y] if y < len(signature) else None
+            if last is not None and row == (last[y] if y < len(last) else None):
+                continue
 
-        # Draw notifications
-        for i, notification in enumerate(self.notifications):
-            if i >= NOTIFICATION_HEIGHT:
-                break
+            self.window.put_string(0, y, _BLANK_ROW, Color.TEXT_PRIMARY)
+            if row is not None:
+                text, color = row
+                self.window.put_string(1, y, text, color)
 
-            color = notification.get_faded_color()
-            self.window.put_string(1, i, notification.text, color)
+        self._last_signature = signature
 
     def handle_event(self, event: dict):
         """Handle a game event and create appropriate notification.
@@ -109,59 +205,44 @@ class NotificationManager:
         Args:
             event: Event dictionary from server
         """
-        event_type = event.get("type", "")
-        message = event.get("message", "")
-
-        if event_type == "spawned":
-            self.add_success(f"Spawned: {message}")
-
-        elif event_type == "error":
-            self.add_error(f"Error: {message}")
-
-        elif event_type == "push":
-            pass  # Silent, visual feedback handles this
-
-        elif event_type == "blocked":
-            self.add_warning("Blocked!")
-
-        elif event_type == "recording_started":
-            self.add_warning("Recording started")
-
-        elif event_type == "recording_stopped":
-            self.add_info("Recording stopped")
-
-        elif event_type == "autorepeat_started":
-            self.add_success("Playback started")
-
-        elif event_type == "autorepeat_stopped":
-            self.add_info("Playback stopped")
-
-        elif event_type == "crafting_started":
-            recipe = event.get("recipe_id", "item")
-            self.add_success(f"Crafting: {recipe}")
-
-        elif event_type == "crafting_blocked":
-            self.add_warning("Crafting blocked - missing inputs")
-
-        elif event_type == "wagon_hitched":
-            self.add_info("Wagon hitched")
-
-        elif event_type == "wagon_unhitched":
-            self.add_info("Wagon unhitched")
-
-        elif event_type == "item_unloaded":
-            self.add_info("Item unloaded from wagon")
-
-        elif event_type == "interact":
-            pass  # Context panel handles this
-
-        elif event_type == "message":
-            if message:
-                self.add_info(message)
+        handler = _EVENT_HANDLERS.get(event.get("type", ""))
+        if handler is not None:
+            handler(self, event.get("message", ""), event)
 
     def clear(self):
         """Clear all notifications."""
         self.notifications.clear()
+        self._next_expiry = float("inf")
+
+
+def _notify_message(manager: "NotificationManager", message: str, event: dict):
+    """Show a server message as info, skipping empty ones."""
+    if message:
+        manager.add_info(message)
+
+
+# Notification builders by event type: (manager, message, event) -> None.
+# "push" and "interact" are silent - the visual feedback and the context
+# panel cover them
+_EVENT_HANDLERS = {
+    "spawned": lambda manager, message, event: manager.add_success(f"Spawned: {message}"),
+    "error": lambda manager, message, event: manager.add_error(f"Error: {message}"),
+    "blocked": lambda manager, message, event: manager.add_warning("Blocked!"),
+    "recording_started": lambda manager, message, event: manager.add_warning("Recording started"),
+    "recording_stopped": lambda manager, message, event: manager.add_info("Recording stopped"),
+    "autorepeat_started": lambda manager, message, event: manager.add_success("Playback started"),
+    "autorepeat_stopped": lambda manager, message, event: manager.add_info("Playback stopped"),
+    "crafting_started": lambda manager, message, event: manager.add_success(
+        f"Crafting: {event.get('recipe_id', 'item')}"
+    ),
+    "crafting_blocked": lambda manager, message, event: manager.add_warning(
+        "Crafting blocked - missing inputs"
+    ),
+    "wagon_hitched": lambda manager, message, event: manager.add_info("Wagon hitched"),
+    "wagon_unhitched": lambda manager, message, event: manager.add_info("Wagon unhitched"),
+    "item_unloaded": lambda manager, message, event: manager.add_info("Item unloaded from wagon"),
+    "message": _notify_message,
+}
 
 
 class SpeechBubble:
@@ -185,27 +266,15 @@ class SpeechBubble:
         # Wrap text
         self.lines = self._wrap_text(text, max_width=22)
 
+        # The text never changes, so build the rows once
+        self._width = max((len(line) for line in self.lines), default=0) + 2
+        self._top = _TL + _BLOCK * self._width + _TR
+        self._bottom = _BL + _BLOCK * self._width + _BR
+        self._padded = tuple(line.ljust(self._width) for line in self.lines)
+
     def _wrap_text(self, text: str, max_width: int) -> List[str]:
         """Wrap text to fit width."""
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            if current_length + len(word) + 1 <= max_width:
-                current_line.append(word)
-                current_length += len(word) + 1
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        return lines
+        return list(_wrap_lines(text, max_width))
 
     @property
     def is_expired(self) -> bool:
@@ -231,40 +300,34 @@ class SpeechBubble:
         if screen_x < 0 or screen_y < 0:
             return
 
-        width = max(len(line) for line in self.lines) + 2
+        self.draw_at(window, screen_x, screen_y)
+
+    def draw_at(self, window, x: int, y: int):
+        """Draw the bubble with its top-left corner at a window position.
+
+        Args:
+            window: pyunicodegame window
+            x, y: Top-left corner in window coordinates
+        """
         bubble_color = Color.BUBBLE_COLOR
         text_color = Color.BUBBLE_TEXT
-
-        # Wedge characters for rounded corners
-        TL = chr(0x1FB3C + 5)   # 🭁
-        TR = chr(0x1FB3C + 16)  # 🭌
-        BL = chr(0x1FB3C + 22)  # 🭒
-        BR = chr(0x1FB3C + 33)  # 🭝
-        BLOCK = chr(0x2588)    # █
-        TAIL = chr(0x1FB3C + 29)  # 🭙
+        right_x = x + self._width + 1
 
         # Top border with rounded corners
-        window.put(screen_x, screen_y, TL, bubble_color)
-        for i in range(1, width + 1):
-            window.put(screen_x + i, screen_y, BLOCK, bubble_color)
-        window.put(screen_x + width + 1, screen_y, TR, bubble_color)
+        window.put_string(x, y, self._top, bubble_color)
 
         # Content rows with solid background (same color as border)
-        for i, line in enumerate(self.lines):
-            padded = line.ljust(width)
-            window.put(screen_x, screen_y + 1 + i, BLOCK, bubble_color)
-            window.put_string(screen_x + 1, screen_y + 1 + i, padded, text_color, bubble_color)
-            window.put(screen_x + width + 1, screen_y + 1 + i, BLOCK, bubble_color)
+        for i, padded in enumerate(self._padded, 1):
+            window.put(x, y + i, _BLOCK, bubble_color)
+            window.put_string(x + 1, y + i, padded, text_color, bubble_color)
+            window.put(right_x, y + i, _BLOCK, bubble_color)
 
         # Bottom border with rounded corners
-        bottom_y = screen_y + len(self.lines) + 1
-        window.put(screen_x, bottom_y, BL, bubble_color)
-        for i in range(1, width + 1):
-            window.put(screen_x + i, bottom_y, BLOCK, bubble_color)
-        window.put(screen_x + width + 1, bottom_y, BR, bubble_color)
+        bottom_y = y + len(self._padded) + 1
+        window.put_string(x, bottom_y, self._bottom, bubble_color)
 
         # Tail pointing down
-        window.put(screen_x + 1, bottom_y + 1, TAIL, bubble_color)
+        window.put(x + 1, bottom_y + 1, _TAIL, bubble_color)
 
 
 class TutorialManager:
@@ -362,50 +425,16 @@ class TutorialManager:
             player_y: Player's world Y position
         """
         self.update()
-        if not self.active_text:
+        bubble = self.active_bubble
+        if not self.active_text or not bubble:
             return
 
-        lines = self.active_bubble.lines if self.active_bubble else [self.active_text]
-
         # Position bubble above and to the right of player in world coords
         bubble_x = player_x + 2
-        bubble_y = max(0, player_y - len(lines) - 3)
+        bubble_y = max(0, player_y - len(bubble.lines) - 3)
 
         # Draw speech bubble
-        width = max(len(line) for line in lines) + 2
-        bubble_color = Color.BUBBLE_COLOR
-        text_color = Color.BUBBLE_TEXT
-
-        # Wedge characters for rounded corners
-        TL = chr(0x1FB3C + 5)   # 🭁
-        TR = chr(0x1FB3C + 16)  # 🭌
-        BL = chr(0x1FB3C + 22)  # 🭒
-        BR = chr(0x1FB3C + 33)  # 🭝
-        BLOCK = chr(0x2588)    # █
-        TAIL = chr(0x1FB3C + 29)  # 🭙
-
-        # Top border with rounded corners
-        window.put(bubble_x, bubble_y, TL, bubble_color)
-        for i in range(1, width + 1):
-            window.put(bubble_x + i, bubble_y, BLOCK, bubble_color)
-        window.put(bubble_x + width + 1, bubble_y, TR, bubble_color)
-
-        # Content lines with solid background (same color as border)
-        for i, line in enumerate(lines):
-            padded = line.ljust(width)
-            window.put(bubble_x, bubble_y + 1 + i, BLOCK, bubble_color)
-            window.put_string(bubble_x + 1, bubble_y + 1 + i, padded, text_color, bubble_color)
-            window.put(bubble_x + width + 1, bubble_y + 1 + i, BLOCK, bubble_color)
-
-        # Bottom border with rounded corners
-        bottom_y = bubble_y + len(lines) + 1
-        window.put(bubble_x, bottom_y, BL, bubble_color)
-        for i in range(1, width + 1):
-            window.put(bubble_x + i, bottom_y, BLOCK, bubble_color)
-        window.put(bubble_x + width + 1, bottom_y, BR, bubble_color)
-
-        # Tail pointing down
-        window.put(bubble_x + 1, bottom_y + 1, TAIL, bubble_color)
+        bubble.draw_at(window, bubble_x, bubble_y)
 
     def on_key_press(self) -> bool:
         """Handle key press to dismiss bubble.
@@ -1,5 +1,6 @@
 """UI panels for monster info and context display."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from config import (
@@ -13,6 +14,18 @@ from config import (
 )
 
 
+@lru_cache(maxsize=8)
+def _blank_row(width: int) -> str:
+    """Build (and memoize) a row of spaces for clearing a panel."""
+    return " " * width
+
+
+@lru_cache(maxsize=8)
+def _border_row(width: int) -> str:
+    """Build (and memoize) a panel's top/bottom border."""
+    return "+" + "-" * (width - 2) + "+"
+
+
 class MonsterPanel:
     """Panel displaying the player's monster information."""
 
@@ -108,16 +121,17 @@ class MonsterPanel:
 
     def _clear(self):
         """Clear the panel."""
+        blank = _blank_row(self.width)
         for y in range(self.height):
-            self.window.put_string(0, y, " " * self.width, Color.TEXT_PRIMARY)
+            self.window.put_string(0, y, blank, Color.TEXT_PRIMARY)
 
     def _draw_border(self):
         """Draw panel border."""
         # Top
-        self.window.put_string(0, 0, "+" + "-" * (self.width - 2) + "+", Color.PANEL_BORDER)
+        self.window.put_string(0, 0, _border_row(self.width), Color.PANEL_BORDER)
         # Bottom
         self.window.put_string(
-            0, self.height - 1, "+" + "-" * (self.width - 2) + "+", Color.PANEL_BORDER
+            0, self.height - 1, _border_row(self.width), Color.PANEL_BORDER
         )
         # Sides
         for y in range(1, self.height - 1):
@@ -184,14 +198,15 @@ class ContextPanel:
 
     def _clear(self):
         """Clear the panel."""
+        blank = _blank_row(self.width)
         for y in range(self.height):
-            self.window.put_string(0, y, " " * self.width, Color.TEXT_PRIMARY)
+            self.window.put_string(0, y, blank, Color.TEXT_PRIMARY)
 
     def _draw_border(self):
         """Draw panel border."""
-        self.window.put_string(0, 0, "+" + "-" * (self.width - 2) + "+", Color.PANEL_BORDER)
+        self.window.put_string(0, 0, _border_row(self.width), Color.PANEL_BORDER)
         self.window.put_string(
-            0, self.height - 1, "+" + "-" * (self.width - 2) + "+", Color.PANEL_BORDER
+            0, self.height - 1, _border_row(self.width), Color.PANEL_BORDER
         )
         for y in range(1, self.height - 1):
             self.window.put(0, y, "|", Color.PANEL_BORDER)